@@ -231,6 +231,8 @@ class LoggingSettings(BaseSettings):
     file_path: str = Field("logs/discord.log", description="Log file path")
     file_max_bytes: int = Field(10_000_000, description="Maximum log file size in bytes")
     file_backup_count: int = Field(5, description="Number of backup log files to keep")
+    file_buffer_size: int = Field(0, description="Bytes to buffer before writing log files (0 writes every record)")
+    file_flush_interval: float = Field(5.0, description="Seconds between background flushes of buffered log files")
     
     # Console logging
     console_enabled: bool = Field(True, description="Enable console logging")
@@ -44,8 +44,10 @@ def validate_configuration() -> Settings:
         
     except ValidationError as e:
         error_messages = []
+        # errors() rebuilds the list on every call; walk it once
+        errors = e.errors()
         
-        for error in e.errors():
+        for error in errors:
             field_path = " -> ".join(str(loc) for loc in error['loc'])
             error_msg = f"{field_path}: {error['msg']}"
             
@@ -61,7 +63,7 @@ def validate_configuration() -> Settings:
         
         raise ConfigurationError(
             f"Configuration validation failed:\n" + "\n".join(f"  • {msg}" for msg in error_messages),
-            e.errors()
+            errors
         )
 
 
@@ -2,7 +2,7 @@
 Core module for the Discord Prediction Market Bot.
 
 This module provides the foundational components for dependency injection,
-service management, rate limiting, and application lifecycle.
+service management, rate limiting, audit logging, and application lifecycle.
 """
 
 from .container import DIContainer, ServiceLifecycle
@@ -29,6 +29,7 @@ from .rate_limit_middleware import (
     guild_prediction_limit,
     get_rate_limit_middleware
 )
+from .security import get_audit_logger, shutdown_audit_logger
 
 __all__ = [
     # Dependency Injection
@@ -56,5 +57,9 @@ __all__ = [
     "user_prediction_limit",
     "guild_request_limit",
     "guild_prediction_limit",
-    "get_rate_limit_middleware"
+    "get_rate_limit_middleware",
+    
+    # Audit Logging
+    "get_audit_logger",
+    "shutdown_audit_logger"
 ]
\ No newline at end of file
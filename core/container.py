@@ -13,9 +13,10 @@ import asyncio
 import inspect
 import logging
 from abc import ABC, abstractmethod
+from contextvars import ContextVar
 from enum import Enum
 from typing import (
-    Any, Callable, Dict, List, Optional, Type, TypeVar, Union,
+    Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar, Union,
     get_type_hints, get_origin, get_args
 )
 from weakref import WeakSet
@@ -127,7 +128,14 @@ class DIContainer:
     
     def __init__(self):
         self._services: Dict[str, ServiceDescriptor] = {}
-        self._resolution_stack: List[str] = []
+        # Resolved singleton instances keyed by service name; checked before
+        # the full resolution path so repeat lookups are a single dict hit
+        self._singleton_instances: Dict[str, Any] = {}
+        # Per-task resolution chain so concurrent resolutions (see
+        # initialize_all_singletons) cannot see each other's services
+        self._resolution_stack: ContextVar[Tuple[str, ...]] = ContextVar(
+            f"di_resolution_stack_{id(self)}", default=()
+        )
         self._current_scope: Optional[IServiceScope] = None
         self._disposed = False
         self._initialization_lock = asyncio.Lock()
@@ -225,6 +233,7 @@ class DIContainer:
         descriptor.instance = instance
         
         self._services[service_name] = descriptor
+        self._singleton_instances[service_name] = instance
         logger.debug(f"Registered instance for service: {service_name}")
         
         return self
@@ -266,6 +275,9 @@ class DIContainer:
             raise DIContainerError("Container has been disposed")
         
         service_name = self._get_service_name(service_type)
+        instance = self._singleton_instances.get(service_name)
+        if instance is not None:
+            return instance
         return await self._resolve_service(service_name)
     
     async def get_service_by_name(self, service_name: str) -> Any:
@@ -281,6 +293,9 @@ class DIContainer:
         if self._disposed:
             raise DIContainerError("Container has been disposed")
         
+        instance = self._singleton_instances.get(service_name)
+        if instance is not None:
+            return instance
         return await self._resolve_service(service_name)
     
     def create_scope(self) -> IServiceScope:
@@ -341,20 +356,55 @@ class DIContainer:
         Initialize all registered singleton services.
         
         This is useful for eager initialization of critical services.
+        Singletons are grouped into dependency levels and each level is
+        initialized concurrently, so independent services (e.g. the database
+        pool and the points API client) start up in parallel.
         """
         async with self._initialization_lock:
-            singleton_services = [
-                name for name, descriptor in self._services.items()
-                if descriptor.lifecycle == ServiceLifecycle.SINGLETON
-            ]
-            
-            for service_name in singleton_services:
-                try:
-                    await self._resolve_service(service_name)
+            for level in self._get_singleton_levels():
+                results = await asyncio.gather(
+                    *(self._resolve_service(name) for name in level),
+                    return_exceptions=True
+                )
+                
+                for service_name, result in zip(level, results):
+                    if isinstance(result, BaseException):
+                        logger.error(f"Failed to initialize singleton service {service_name}: {result}")
+                        raise result
                     logger.debug(f"Initialized singleton service: {service_name}")
-                except Exception as e:
-                    logger.error(f"Failed to initialize singleton service {service_name}: {e}")
-                    raise
+    
+    def _get_singleton_levels(self) -> List[List[str]]:
+        """
+        Group uninitialized singletons by dependency depth.
+        
+        A singleton's level is one more than the deepest registered service it
+        depends on, so every level only needs services from earlier levels.
+        Cycles are left for _resolve_service to report.
+        """
+        depths: Dict[str, int] = {}
+        
+        def depth(service_name: str, visiting: Tuple[str, ...]) -> int:
+            if service_name in depths:
+                return depths[service_name]
+            descriptor = self._services.get(service_name)
+            if descriptor is None or service_name in visiting:
+                return -1
+            
+            visiting = visiting + (service_name,)
+            result = 1 + max(
+                (depth(dep, visiting) for dep in descriptor.dependencies.values()),
+                default=-1
+            )
+            depths[service_name] = result
+            return result
+        
+        levels: Dict[int, List[str]] = {}
+        for service_name, descriptor in self._services.items():
+            if descriptor.lifecycle != ServiceLifecycle.SINGLETON or descriptor.instance is not None:
+                continue
+            levels.setdefault(depth(service_name, ()), []).append(service_name)
+        
+        return [levels[level] for level in sorted(levels)]
     
     async def dispose_async(self) -> None:
         """
@@ -373,7 +423,7 @@ class DIContainer:
         
         # Clear all services
         self._services.clear()
-        self._resolution_stack.clear()
+        self._singleton_instances.clear()
         
         logger.info("DI container disposed")
     
@@ -425,8 +475,9 @@ class DIContainer:
             raise ServiceNotFoundError(service_name)
         
         # Check for circular dependencies
-        if service_name in self._resolution_stack:
-            chain = self._resolution_stack + [service_name]
+        resolution_stack = self._resolution_stack.get()
+        if service_name in resolution_stack:
+            chain = list(resolution_stack) + [service_name]
             raise CircularDependencyError(chain)
         
         descriptor = self._services[service_name]
@@ -456,6 +507,7 @@ class DIContainer:
         try:
             instance = await self._create_instance(service_name, descriptor)
             descriptor.instance = instance
+            self._singleton_instances[service_name] = instance
             return instance
         finally:
             descriptor.is_initializing = False
@@ -480,7 +532,9 @@ class DIContainer:
     
     async def _create_instance(self, service_name: str, descriptor: ServiceDescriptor) -> Any:
         """Create a new service instance."""
-        self._resolution_stack.append(service_name)
+        token = self._resolution_stack.set(
+            self._resolution_stack.get() + (service_name,)
+        )
         
         try:
             # Resolve dependencies
@@ -509,7 +563,7 @@ class DIContainer:
             return instance
             
         finally:
-            self._resolution_stack.pop()
+            self._resolution_stack.reset(token)
     
     def _extract_dependencies(self, target: Union[Type, Callable]) -> Dict[str, str]:
         """Extract dependency parameter names and their service types from constructor or factory function."""
@@ -542,10 +596,8 @@ class DIContainer:
     
     def _get_service_name(self, service_type: Type) -> str:
         """Get the service name for a given type."""
-        if hasattr(service_type, '__name__'):
-            return service_type.__name__
-        else:
-            return str(service_type)
+        name = getattr(service_type, '__name__', None)
+        return name if name is not None else str(service_type)
     
     async def _dispose_instance(self, instance: Any) -> None:
         """Dispose of a service instance."""
@@ -558,8 +610,12 @@ class DIContainer:
             logger.error(f"Error disposing instance {type(instance).__name__}: {e}")
 
 
-# Global container instance
-_container: Optional[DIContainer] = None
+# Global container instance, bound at import so get_container() needs no
+# lazy check. Code that may run after set_container() should call
+# get_container() instead of importing ``container``, which keeps the
+# instance bound at import.
+container: DIContainer = DIContainer()
+_container: DIContainer = container
 
 
 def get_container() -> DIContainer:
@@ -569,18 +625,19 @@ def get_container() -> DIContainer:
     Returns:
         The global DI container
     """
-    global _container
-    if _container is None:
-        _container = DIContainer()
     return _container
 
 
-def set_container(container: DIContainer) -> None:
+def set_container(new_container: DIContainer) -> None:
     """
     Set the global DI container instance.
     
+    get_container() returns the new instance. Names bound by an earlier
+    ``from core.container import container`` keep the previous one.
+    
     Args:
-        container: The DI container to set as global
+        new_container: The DI container to set as global
     """
-    global _container
-    _container = container
\ No newline at end of file
+    global _container, container
+    _container = new_container
+    container = new_container
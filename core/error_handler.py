@@ -13,10 +13,11 @@ import asyncio
 import logging
 import time
 import traceback
+from collections import deque
 from datetime import datetime, timedelta
 from enum import Enum
 from functools import wraps
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from typing import Any, Callable, Deque, Dict, List, Optional, Type, Union
 from weakref import WeakSet
 
 import discord
@@ -101,11 +102,37 @@ class CircuitBreaker:
             return result
             
         except self.expected_exception as e:
-            self._on_failure()
-            raise ExternalAPIError(
-                service=func.__name__,
-                details={"original_error": str(e), "circuit_breaker_state": self.state.value}
-            ) from e
+            raise self._failure_error(func, e) from e
+    
+    async def call_fast(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Execute a coroutine function with circuit breaker protection.
+        
+        Equivalent to call() for coroutine functions, but while the circuit is
+        closed it awaits the function directly and only falls back to the full
+        state machine when the circuit is open or half-open.
+        
+        Args:
+            func: Coroutine function to execute
+            *args: Function arguments
+            **kwargs: Function keyword arguments
+            
+        Returns:
+            Function result
+            
+        Raises:
+            ExternalAPIError: When circuit is open or function fails
+        """
+        if self.state is not CircuitBreakerState.CLOSED:
+            return await self.call(func, *args, **kwargs)
+        
+        try:
+            result = await func(*args, **kwargs)
+        except self.expected_exception as e:
+            raise self._failure_error(func, e) from e
+        
+        self._on_success()
+        return result
     
     def _should_attempt_reset(self) -> bool:
         """Check if enough time has passed to attempt reset."""
@@ -127,6 +154,14 @@ class CircuitBreaker:
         self.failure_count = 0
         self.state = CircuitBreakerState.CLOSED
     
+    def _failure_error(self, func: Callable, error: Exception) -> ExternalAPIError:
+        """Record a failed call and build the error to raise for it."""
+        self._on_failure()
+        return ExternalAPIError(
+            service=func.__name__,
+            details={"original_error": str(error), "circuit_breaker_state": self.state.value}
+        )
+    
     def _on_failure(self) -> None:
         """Handle failed call."""
         self.failure_count += 1
@@ -242,8 +277,9 @@ class ErrorHandler:
         self.logger = logging.getLogger(__name__)
         self.circuit_breakers: Dict[str, CircuitBreaker] = {}
         self.error_stats: Dict[str, int] = {}
-        self.recent_errors: List[Dict[str, Any]] = []
         self.max_recent_errors = 100
+        # Bounded buffer: appends are O(1) and the oldest error drops automatically
+        self.recent_errors: Deque[Dict[str, Any]] = deque(maxlen=self.max_recent_errors)
         
         # Error message templates
         self.error_templates = {
@@ -274,14 +310,15 @@ class ErrorHandler:
         Returns:
             Circuit breaker instance
         """
-        if service_name not in self.circuit_breakers:
-            self.circuit_breakers[service_name] = CircuitBreaker(
+        circuit_breaker = self.circuit_breakers.get(service_name)
+        if circuit_breaker is None:
+            circuit_breaker = self.circuit_breakers[service_name] = CircuitBreaker(
                 failure_threshold=failure_threshold,
                 timeout_seconds=timeout_seconds,
                 expected_exception=expected_exception
             )
         
-        return self.circuit_breakers[service_name]
+        return circuit_breaker
     
     async def handle_discord_error(
         self,
@@ -423,10 +460,8 @@ class ErrorHandler:
         error_type = error_info['error_code']
         self.error_stats[error_type] = self.error_stats.get(error_type, 0) + 1
         
-        # Add to recent errors (with size limit)
+        # Add to recent errors (deque enforces the size limit)
         self.recent_errors.append(error_info)
-        if len(self.recent_errors) > self.max_recent_errors:
-            self.recent_errors.pop(0)
         
         # Log with appropriate level
         severity = ErrorSeverity(error_info['severity'])
@@ -559,7 +594,7 @@ class ErrorHandler:
         Returns:
             List of recent error dictionaries
         """
-        return self.recent_errors[-limit:] if self.recent_errors else []
+        return list(self.recent_errors)[-limit:] if self.recent_errors else []
 
 
 # Global error handler instance
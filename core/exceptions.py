@@ -2,12 +2,24 @@
 Core exceptions for the prediction market bot system.
 """
 
-import uuid
+import itertools
+import json
+import os
 from datetime import datetime
 from typing import Optional, Dict, Any
 from enum import Enum
 
 
+# Shared encoder for error payloads; json.dumps with non-default options
+# would construct a new JSONEncoder on every call
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, default=str)
+
+
+# Error IDs come from a counter seeded randomly per process; this is much
+# cheaper than drawing a uuid4 per exception and still unique in practice
+_error_id_counter = itertools.count(int.from_bytes(os.urandom(4), 'big'))
+
+
 class ErrorSeverity(Enum):
     """Error severity levels for categorization and handling."""
     LOW = "low"
@@ -42,7 +54,7 @@ class PredictionMarketError(Exception):
     
     def _generate_error_id(self) -> str:
         """Generate a unique error ID for tracking."""
-        return str(uuid.uuid4())[:8].upper()
+        return f"{next(_error_id_counter) & 0xFFFFFFFF:08X}"
     
     def _get_default_user_message(self) -> str:
         """Get default user-friendly message for Discord interactions."""
@@ -60,6 +72,10 @@ class PredictionMarketError(Exception):
             "timestamp": self.timestamp.isoformat(),
             "type": self.__class__.__name__
         }
+    
+    def to_json(self) -> str:
+        """Serialize the error to a JSON string for logging and transport."""
+        return _JSON_ENCODER.encode(self.to_dict())
 
 
 # Validation Errors
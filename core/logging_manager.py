@@ -14,6 +14,7 @@ import logging
 import logging.handlers
 import os
 import sys
+import threading
 import time
 import uuid
 from contextvars import ContextVar
@@ -29,10 +30,17 @@ from config.settings import LoggingSettings
 # Context variable for correlation ID tracking
 correlation_id: ContextVar[Optional[str]] = ContextVar('correlation_id', default=None)
 
+# Shared encoder for log entries; json.dumps(..., ensure_ascii=False) would
+# construct a new JSONEncoder for every record
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
 
-@dataclass
+# dataclass(slots=True) is only available from Python 3.10
+_DATACLASS_SLOTS: Dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class LogContext:
-    """Context information for structured logging."""
+    """Context information for structured logging (immutable, slotted where supported)."""
     correlation_id: Optional[str] = None
     user_id: Optional[int] = None
     guild_id: Optional[int] = None
@@ -99,7 +107,7 @@ class JSONFormatter(logging.Formatter):
             if extra_fields:
                 log_entry['extra'] = extra_fields
         
-        return json.dumps(log_entry, ensure_ascii=False)
+        return _JSON_ENCODER.encode(log_entry)
 
 
 class ContextualFormatter(logging.Formatter):
@@ -138,6 +146,92 @@ class ContextualFormatter(logging.Formatter):
         return formatter.format(record)
 
 
+class BufferedFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotating file handler that batches writes in memory.
+    
+    Records are written into a buffer of ``buffer_size`` bytes instead of
+    being flushed one by one. The buffer is flushed when it fills, every
+    ``flush_interval`` seconds from a daemon thread, on any record at or
+    above ``flush_level``, and when the handler is closed.
+    """
+    
+    def __init__(
+        self,
+        filename: str,
+        maxBytes: int = 0,
+        backupCount: int = 0,
+        encoding: Optional[str] = None,
+        buffer_size: int = 65536,
+        flush_interval: float = 5.0,
+        flush_level: int = logging.ERROR
+    ):
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        self._size = 0
+        self._stream_encoding = encoding or 'utf-8'
+        super().__init__(
+            filename,
+            maxBytes=maxBytes,
+            backupCount=backupCount,
+            encoding=encoding
+        )
+        
+        self._stop_flusher = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if flush_interval > 0:
+            self._flusher = threading.Thread(
+                target=self._flush_periodically,
+                name="BufferedFileHandlerFlush",
+                daemon=True
+            )
+            self._flusher.start()
+    
+    def _open(self):
+        """Open the log file with a write buffer of buffer_size bytes."""
+        stream = open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding
+        )
+        self._size = os.path.getsize(self.baseFilename)
+        self._stream_encoding = stream.encoding
+        return stream
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write the record to the buffer, flushing only for severe records."""
+        try:
+            msg = self.format(record) + self.terminator
+            # Track the size ourselves; RotatingFileHandler.shouldRollover
+            # seeks the stream, which would flush the buffer on every record.
+            # maxBytes counts encoded bytes; ASCII text is one byte a character
+            size = len(msg) if msg.isascii() else len(msg.encode(self._stream_encoding, 'replace'))
+            if self.maxBytes > 0 and self._size + size >= self.maxBytes:
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(msg)
+            self._size += size
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def _flush_periodically(self) -> None:
+        """Flush the buffer every flush_interval seconds until closed."""
+        while not self._stop_flusher.wait(self.flush_interval):
+            self.flush()
+    
+    def close(self) -> None:
+        """Stop the background flusher and flush remaining records."""
+        self._stop_flusher.set()
+        super().close()
+
+
 class LoggingManager:
     """Centralized logging manager with structured logging capabilities."""
     
@@ -185,13 +279,23 @@ class LoggingManager:
         log_path = Path(self.settings.file_path)
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Create rotating file handler
-        file_handler = logging.handlers.RotatingFileHandler(
-            filename=self.settings.file_path,
-            maxBytes=self.settings.file_max_bytes,
-            backupCount=self.settings.file_backup_count,
-            encoding='utf-8'
-        )
+        # Create rotating file handler, buffered when configured
+        if self.settings.file_buffer_size > 0:
+            file_handler = BufferedFileHandler(
+                filename=self.settings.file_path,
+                maxBytes=self.settings.file_max_bytes,
+                backupCount=self.settings.file_backup_count,
+                encoding='utf-8',
+                buffer_size=self.settings.file_buffer_size,
+                flush_interval=self.settings.file_flush_interval
+            )
+        else:
+            file_handler = logging.handlers.RotatingFileHandler(
+                filename=self.settings.file_path,
+                maxBytes=self.settings.file_max_bytes,
+                backupCount=self.settings.file_backup_count,
+                encoding='utf-8'
+            )
         
         file_handler.addFilter(correlation_filter)
         
@@ -322,14 +426,15 @@ def log_function_call(
             if logger is None:
                 logger = logging.getLogger(func.__module__)
             
-            # Generate correlation ID if not present
-            try:
-                corr_id = get_correlation_id()
-                if corr_id is None:
+            # Generate correlation ID if not present; read the context
+            # variable directly to skip the manager lookup on every call
+            corr_id = correlation_id.get()
+            if corr_id is None:
+                try:
                     corr_id = set_correlation_id()
-            except:
-                # Fallback if global logging manager is not available
-                corr_id = str(uuid.uuid4())
+                except:
+                    # Fallback if global logging manager is not available
+                    corr_id = str(uuid.uuid4())
             
             # Prepare log context
             context_data = {
@@ -362,7 +467,8 @@ def log_function_call(
             # Log function entry
             logger.log(
                 level,
-                f"Entering function {func.__name__}",
+                "Entering function %s",
+                func.__name__,
                 extra=context_data
             )
             
@@ -385,7 +491,8 @@ def log_function_call(
                 
                 logger.log(
                     level,
-                    f"Exiting function {func.__name__}",
+                    "Exiting function %s",
+                    func.__name__,
                     extra=exit_context
                 )
                 
@@ -401,7 +508,9 @@ def log_function_call(
                 
                 logger.log(
                     logging.ERROR,
-                    f"Exception in function {func.__name__}: {e}",
+                    "Exception in function %s: %s",
+                    func.__name__,
+                    e,
                     extra=error_context
                 )
                 
@@ -414,14 +523,15 @@ def log_function_call(
             if logger is None:
                 logger = logging.getLogger(func.__module__)
             
-            # Generate correlation ID if not present
-            try:
-                corr_id = get_correlation_id()
-                if corr_id is None:
+            # Generate correlation ID if not present; read the context
+            # variable directly to skip the manager lookup on every call
+            corr_id = correlation_id.get()
+            if corr_id is None:
+                try:
                     corr_id = set_correlation_id()
-            except:
-                # Fallback if global logging manager is not available
-                corr_id = str(uuid.uuid4())
+                except:
+                    # Fallback if global logging manager is not available
+                    corr_id = str(uuid.uuid4())
             
             # Prepare log context
             context_data = {
@@ -455,7 +565,8 @@ def log_function_call(
             # Log function entry
             logger.log(
                 level,
-                f"Entering async function {func.__name__}",
+                "Entering async function %s",
+                func.__name__,
                 extra=context_data
             )
             
@@ -478,7 +589,8 @@ def log_function_call(
                 
                 logger.log(
                     level,
-                    f"Exiting async function {func.__name__}",
+                    "Exiting async function %s",
+                    func.__name__,
                     extra=exit_context
                 )
                 
@@ -494,7 +606,9 @@ def log_function_call(
                 
                 logger.log(
                     logging.ERROR,
-                    f"Exception in async function {func.__name__}: {e}",
+                    "Exception in async function %s: %s",
+                    func.__name__,
+                    e,
                     extra=error_context
                 )
                 
@@ -538,14 +652,13 @@ def log_performance(
                 if logger is None:
                     logger = logging.getLogger(func.__module__)
                 
-                try:
-                    corr_id = get_correlation_id()
-                except:
-                    corr_id = 'none'
+                corr_id = correlation_id.get()
                 
                 logger.log(
                     level,
-                    f"Slow function execution: {func.__name__} took {duration:.3f}s",
+                    "Slow function execution: %s took %.3fs",
+                    func.__name__,
+                    duration,
                     extra={
                         'function_name': func.__name__,
                         'function_module': func.__module__,
@@ -568,14 +681,13 @@ def log_performance(
                 if logger is None:
                     logger = logging.getLogger(func.__module__)
                 
-                try:
-                    corr_id = get_correlation_id()
-                except:
-                    corr_id = 'none'
+                corr_id = correlation_id.get()
                 
                 logger.log(
                     level,
-                    f"Slow async function execution: {func.__name__} took {duration:.3f}s",
+                    "Slow async function execution: %s took %.3fs",
+                    func.__name__,
+                    duration,
                     extra={
                         'function_name': func.__name__,
                         'function_module': func.__module__,
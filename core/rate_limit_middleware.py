@@ -7,7 +7,7 @@ to Discord commands and interactions.
 
 import asyncio
 import functools
-from typing import Callable, Optional, List, Union, Any
+from typing import Callable, Optional, Union, Any, Iterable
 import logging
 
 import discord
@@ -61,11 +61,11 @@ def rate_limit(
             if ctx:
                 user_id = ctx.author.id
                 guild_id = ctx.guild.id if ctx.guild else None
-                user_roles = [role.id for role in ctx.author.roles] if hasattr(ctx.author, 'roles') else None
+                user_roles = frozenset(role.id for role in ctx.author.roles) if hasattr(ctx.author, 'roles') else None
             elif interaction:
                 user_id = interaction.user.id
                 guild_id = interaction.guild.id if interaction.guild else None
-                user_roles = [role.id for role in interaction.user.roles] if hasattr(interaction.user, 'roles') else None
+                user_roles = frozenset(role.id for role in interaction.user.roles) if hasattr(interaction.user, 'roles') else None
             else:
                 logger.error(f"Could not extract user/guild info from command arguments in {func.__name__}")
                 return await func(*args, **kwargs)
@@ -167,7 +167,7 @@ class RateLimitMiddleware:
         user_id: int,
         guild_id: Optional[int] = None,
         limit_type: RateLimitType = RateLimitType.USER_REQUESTS,
-        user_roles: Optional[List[int]] = None
+        user_roles: Optional[Iterable[int]] = None
     ) -> RateLimitInfo:
         """
         Check rate limit for a user/guild combination.
@@ -176,7 +176,7 @@ class RateLimitMiddleware:
             user_id: Discord user ID
             guild_id: Discord guild ID (optional)
             limit_type: Type of rate limit to check
-            user_roles: List of user role IDs for admin bypass
+            user_roles: User role IDs for admin bypass
             
         Returns:
             RateLimitInfo: Rate limit status information
@@ -193,7 +193,7 @@ class RateLimitMiddleware:
         user_id: int,
         guild_id: Optional[int] = None,
         limit_type: RateLimitType = RateLimitType.USER_REQUESTS,
-        user_roles: Optional[List[int]] = None
+        user_roles: Optional[Iterable[int]] = None
     ) -> RateLimitInfo:
         """
         Consume a rate limit slot and return status.
@@ -202,7 +202,7 @@ class RateLimitMiddleware:
             user_id: Discord user ID
             guild_id: Discord guild ID (optional)
             limit_type: Type of rate limit to consume
-            user_roles: List of user role IDs for admin bypass
+            user_roles: User role IDs for admin bypass
             
         Returns:
             RateLimitInfo: Rate limit status information after consumption
@@ -214,6 +214,32 @@ class RateLimitMiddleware:
             user_roles=user_roles
         )
     
+    async def try_consume(
+        self,
+        user_id: int,
+        guild_id: Optional[int] = None,
+        limit_type: RateLimitType = RateLimitType.USER_REQUESTS,
+        user_roles: Optional[Iterable[int]] = None
+    ) -> RateLimitInfo:
+        """
+        Atomically check and consume a rate limit slot.
+        
+        Args:
+            user_id: Discord user ID
+            guild_id: Discord guild ID (optional)
+            limit_type: Type of rate limit to consume
+            user_roles: User role IDs for admin bypass
+            
+        Returns:
+            RateLimitInfo: Rate limit status information after consumption
+        """
+        return await self.rate_limiter.try_consume(
+            user_id=user_id,
+            guild_id=guild_id,
+            limit_type=limit_type,
+            user_roles=user_roles
+        )
+    
     async def handle_rate_limit_exceeded(
         self,
         ctx_or_interaction: Union[commands.Context, discord.Interaction],
@@ -248,6 +274,10 @@ class RateLimitMiddleware:
         """Remove a user from the admin bypass list."""
         self.rate_limiter.remove_admin_user(user_id)
     
+    def is_admin(self, user_id: int) -> bool:
+        """Check if a user is on the admin bypass list."""
+        return self.rate_limiter.is_admin(user_id)
+    
     def add_admin_role(self, role_id: int) -> None:
         """Add a role to the admin bypass list."""
         self.rate_limiter.add_admin_role(role_id)
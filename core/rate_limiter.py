@@ -10,7 +10,7 @@ import time
 from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Optional, Set, Tuple, Any, List
+from typing import Dict, Optional, Set, Tuple, Any, Iterable
 from datetime import datetime, timedelta
 import logging
 
@@ -60,9 +60,10 @@ class RateLimitWindow:
         self.requests.append(timestamp)
         self._cleanup_old_requests()
     
-    def _cleanup_old_requests(self) -> None:
+    def _cleanup_old_requests(self, current_time: float = None) -> None:
         """Remove requests outside the current window."""
-        current_time = time.time()
+        if current_time is None:
+            current_time = time.time()
         cutoff_time = current_time - self.window_seconds
         
         while self.requests and self.requests[0] < cutoff_time:
@@ -171,6 +172,10 @@ class RateLimiter:
         self._admin_users.discard(user_id)
         self.logger.info(f"Removed user {user_id} from rate limit bypass list")
     
+    def is_admin(self, user_id: int) -> bool:
+        """Check if a user is on the admin bypass list."""
+        return user_id in self._admin_users
+    
     def add_admin_role(self, role_id: int) -> None:
         """Add a role to the admin bypass list."""
         self._admin_roles.add(role_id)
@@ -181,7 +186,7 @@ class RateLimiter:
         self._admin_roles.discard(role_id)
         self.logger.info(f"Removed role {role_id} from rate limit bypass list")
     
-    def _is_admin_bypass(self, user_id: int, user_roles: Optional[List[int]] = None) -> bool:
+    def _is_admin_bypass(self, user_id: int, user_roles: Optional[Iterable[int]] = None) -> bool:
         """Check if user should bypass rate limits."""
         if not self.settings.rate_limit.admin_bypass_enabled:
             return False
@@ -191,10 +196,8 @@ class RateLimiter:
             return True
         
         # Check role bypass
-        if user_roles:
-            for role_id in user_roles:
-                if role_id in self._admin_roles:
-                    return True
+        if user_roles is not None:
+            return not self._admin_roles.isdisjoint(user_roles)
         
         return False
     
@@ -256,7 +259,7 @@ class RateLimiter:
         user_id: int,
         guild_id: Optional[int] = None,
         limit_type: RateLimitType = RateLimitType.USER_REQUESTS,
-        user_roles: Optional[List[int]] = None
+        user_roles: Optional[Iterable[int]] = None
     ) -> RateLimitInfo:
         """
         Check if a request should be rate limited.
@@ -265,7 +268,7 @@ class RateLimiter:
             user_id: Discord user ID
             guild_id: Discord guild ID (optional)
             limit_type: Type of rate limit to check
-            user_roles: List of user role IDs for admin bypass check
+            user_roles: User role IDs for admin bypass check
             
         Returns:
             RateLimitInfo: Information about the rate limit status
@@ -323,7 +326,7 @@ class RateLimiter:
         user_id: int,
         guild_id: Optional[int] = None,
         limit_type: RateLimitType = RateLimitType.USER_REQUESTS,
-        user_roles: Optional[List[int]] = None
+        user_roles: Optional[Iterable[int]] = None
     ) -> RateLimitInfo:
         """
         Consume a rate limit slot (record the request).
@@ -332,11 +335,15 @@ class RateLimiter:
             user_id: Discord user ID
             guild_id: Discord guild ID (optional)
             limit_type: Type of rate limit to consume
-            user_roles: List of user role IDs for admin bypass check
+            user_roles: User role IDs for admin bypass check
             
         Returns:
             RateLimitInfo: Information about the rate limit status after consumption
         """
+        # Roles are checked twice below, so materialize any iterator once
+        if user_roles is not None:
+            user_roles = frozenset(user_roles)
+        
         # Check current status
         rate_limit_info = await self.check_rate_limit(user_id, guild_id, limit_type, user_roles)
         
@@ -356,6 +363,77 @@ class RateLimiter:
         
         return rate_limit_info
     
+    async def try_consume(
+        self,
+        user_id: int,
+        guild_id: Optional[int] = None,
+        limit_type: RateLimitType = RateLimitType.USER_REQUESTS,
+        user_roles: Optional[Iterable[int]] = None
+    ) -> RateLimitInfo:
+        """
+        Check and consume a rate limit slot in a single step.
+        
+        Unlike calling check_rate_limit followed by consume_rate_limit, the
+        windows are looked up, trimmed and updated once, with no await in
+        between, so concurrent tasks cannot both claim the last slot.
+        
+        Args:
+            user_id: Discord user ID
+            guild_id: Discord guild ID (optional)
+            limit_type: Type of rate limit to consume
+            user_roles: User role IDs for admin bypass check
+            
+        Returns:
+            RateLimitInfo: Rate limit status after consumption; ``remaining``
+            already accounts for this request
+        """
+        self._stats['total_requests'] += 1
+        
+        if self._is_admin_bypass(user_id, user_roles):
+            self._stats['bypassed_requests'] += 1
+            limit, window_seconds = self._get_rate_limit_config(limit_type)
+            return RateLimitInfo(
+                limit=limit,
+                remaining=limit,
+                reset_time=time.time() + window_seconds,
+                window_seconds=window_seconds,
+                is_exceeded=False
+            )
+        
+        user_window = self._get_or_create_user_window(user_id, limit_type)
+        user_count = user_window.get_current_count()
+        user_exceeded = user_count >= user_window.limit
+        
+        guild_exceeded = False
+        guild_window = None
+        if guild_id and limit_type in [RateLimitType.GUILD_REQUESTS, RateLimitType.GUILD_PREDICTIONS]:
+            guild_window = self._get_or_create_guild_window(guild_id, limit_type)
+            guild_exceeded = guild_window.is_exceeded()
+        
+        is_exceeded = user_exceeded or guild_exceeded
+        
+        if is_exceeded:
+            self._stats['blocked_requests'] += 1
+            self._stats['rate_limit_violations'][limit_type] += 1
+            self.logger.warning(
+                f"Rate limit exceeded for user {user_id} (guild: {guild_id}), "
+                f"type: {limit_type}, user_exceeded: {user_exceeded}, guild_exceeded: {guild_exceeded}"
+            )
+        else:
+            now = time.time()
+            user_window.requests.append(now)
+            user_count += 1
+            if guild_window is not None:
+                guild_window.requests.append(now)
+        
+        return RateLimitInfo(
+            limit=user_window.limit,
+            remaining=max(0, user_window.limit - user_count),
+            reset_time=user_window.requests[0] + user_window.window_seconds if user_window.requests else time.time(),
+            window_seconds=user_window.window_seconds,
+            is_exceeded=is_exceeded
+        )
+    
     def get_user_rate_limit_status(self, user_id: int, limit_type: RateLimitType) -> RateLimitInfo:
         """Get current rate limit status for a user."""
         user_window = self._get_or_create_user_window(user_id, limit_type)
@@ -368,6 +446,45 @@ class RateLimiter:
             is_exceeded=user_window.is_exceeded()
         )
     
+    def get_user_rate_limit_statuses(
+        self,
+        user_id: int,
+        limit_types: Iterable[RateLimitType]
+    ) -> Dict[RateLimitType, RateLimitInfo]:
+        """
+        Get current rate limit status for a user across several limit types.
+        
+        Equivalent to calling get_user_rate_limit_status for each type, but
+        reads the clock once for all of them.
+        
+        Args:
+            user_id: Discord user ID
+            limit_types: Rate limit types to report
+            
+        Returns:
+            Dict mapping each limit type to its RateLimitInfo
+        """
+        current_time = time.time()
+        statuses = {}
+        
+        for limit_type in limit_types:
+            user_window = self._get_or_create_user_window(user_id, limit_type)
+            user_window._cleanup_old_requests(current_time)
+            count = len(user_window.requests)
+            
+            statuses[limit_type] = RateLimitInfo(
+                limit=user_window.limit,
+                remaining=max(0, user_window.limit - count),
+                reset_time=(
+                    user_window.requests[0] + user_window.window_seconds
+                    if user_window.requests else current_time
+                ),
+                window_seconds=user_window.window_seconds,
+                is_exceeded=count >= user_window.limit
+            )
+        
+        return statuses
+    
     def get_guild_rate_limit_status(self, guild_id: int, limit_type: RateLimitType) -> RateLimitInfo:
         """Get current rate limit status for a guild."""
         guild_window = self._get_or_create_guild_window(guild_id, limit_type)
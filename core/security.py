@@ -9,6 +9,7 @@ This module provides:
 - Security monitoring and threat detection
 """
 
+import asyncio
 import hashlib
 import hmac
 import secrets
@@ -16,7 +17,9 @@ import time
 import re
 import html
 import base64
+import functools
 import json
+from collections import deque
 from typing import Any, Dict, List, Optional, Union, Callable
 from datetime import datetime, timedelta
 from enum import Enum
@@ -120,6 +123,23 @@ class InputSanitizer:
     SAFE_FILENAME_PATTERN = re.compile(r'^[a-zA-Z0-9_.-]{1,255}$')
     SAFE_TEXT_PATTERN = re.compile(r'^[a-zA-Z0-9\s\-_.,!?()]+$')
     
+    # Plain words separated by single spaces; sanitize_text returns such
+    # input unchanged unless it also matches FAST_PATH_REJECT_PATTERN
+    FAST_PATH_PATTERN = re.compile(r'\A[A-Za-z0-9_.,?-]+(?: [A-Za-z0-9_.,?-]+)*\Z')
+    FAST_PATH_REJECT_PATTERN = re.compile(
+        '|'.join([
+            SQL_INJECTION_PATTERNS[0].pattern,
+            COMMAND_INJECTION_PATTERNS[1].pattern,
+            r'--',
+            r'script',
+        ]),
+        re.IGNORECASE
+    )
+    
+    # Characters significant in HTML/SQL/shell contexts; one search() scans
+    # the string in C rather than testing each character from Python
+    SPECIAL_CHARS_PATTERN = re.compile(r'[<>"\'&;]')
+    
     @staticmethod
     def sanitize_text(
         text: str,
@@ -145,6 +165,15 @@ class InputSanitizer:
         if not isinstance(text, str):
             text = str(text)
         
+        # Fast path: clean ASCII input that no step below would alter
+        if (
+            (not max_length or len(text) <= max_length)
+            and text.isascii()
+            and InputSanitizer.FAST_PATH_PATTERN.match(text)
+            and not InputSanitizer.FAST_PATH_REJECT_PATTERN.search(text)
+        ):
+            return text
+        
         original_text = text
         
         # Remove null bytes and control characters
@@ -337,6 +366,18 @@ class TokenManager:
         """Generate a cryptographically secure random token."""
         return secrets.token_urlsafe(length)
     
+    def generate_secure_tokens(self, count: int, length: int = 32) -> List[str]:
+        """
+        Generate several secure random tokens from one random read.
+        
+        Tokens have the same format as generate_secure_token(length).
+        """
+        buffer = secrets.token_bytes(count * length)
+        return [
+            base64.urlsafe_b64encode(buffer[start:start + length]).rstrip(b'=').decode('ascii')
+            for start in range(0, count * length, length)
+        ]
+    
     def hash_token(self, token: str, salt: Optional[bytes] = None) -> tuple[str, bytes]:
         """Hash a token with salt for secure comparison."""
         if salt is None:
@@ -373,8 +414,34 @@ class TokenManager:
             return False
 
 
+@functools.lru_cache(maxsize=32)
+def _password_salt(password: bytes) -> bytes:
+    """Get the salt used for new ciphertexts under a password in this process."""
+    return secrets.token_bytes(16)
+
+
+@functools.lru_cache(maxsize=32)
+def _derive_key(password: bytes, salt: bytes) -> bytes:
+    """Derive an encryption key from a password and salt (PBKDF2, memoized)."""
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        iterations=100000,
+    )
+    return base64.urlsafe_b64encode(kdf.derive(password))
+
+
 class DataEncryption:
-    """Data encryption for sensitive information."""
+    """
+    Data encryption for sensitive information.
+    
+    Instances sharing a password share a salt and derived key for the life
+    of the process, so constructing another DataEncryption for a password
+    already seen costs no key derivation. Fernet still uses a fresh IV for
+    every message. The key cache is bounded, so many distinct passwords
+    cannot grow it without limit.
+    """
     
     def __init__(self, password: str):
         """Initialize encryption with password-derived key."""
@@ -383,16 +450,21 @@ class DataEncryption:
             self.logger = get_logger(__name__)
         except Exception:
             self.logger = None
+        
+        self._salt = _password_salt(self.password)
+        self._cipher: Optional[Fernet] = None
+    
+    def _get_cipher(self, salt: bytes) -> Fernet:
+        """Get a cipher for a salt, reusing the instance's own derived key."""
+        if salt != self._salt:
+            return Fernet(self._derive_key(salt))
+        if self._cipher is None:
+            self._cipher = Fernet(self._derive_key(salt))
+        return self._cipher
     
     def _derive_key(self, salt: bytes) -> bytes:
         """Derive encryption key from password and salt."""
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,
-        )
-        return base64.urlsafe_b64encode(kdf.derive(self.password))
+        return _derive_key(self.password, salt)
     
     def encrypt_data(self, data: Union[str, dict, list]) -> str:
         """Encrypt data for secure storage."""
@@ -403,12 +475,9 @@ class DataEncryption:
             else:
                 data_str = str(data)
             
-            # Generate salt and derive key
-            salt = secrets.token_bytes(16)
-            key = self._derive_key(salt)
-            
-            # Encrypt data
-            cipher = Fernet(key)
+            # Encrypt data with the instance's salt and cached key
+            salt = self._salt
+            cipher = self._get_cipher(salt)
             encrypted_data = cipher.encrypt(data_str.encode('utf-8'))
             
             # Combine salt and encrypted data
@@ -428,9 +497,8 @@ class DataEncryption:
             salt = combined[:16]
             encrypted_bytes = combined[16:]
             
-            # Derive key and decrypt
-            key = self._derive_key(salt)
-            cipher = Fernet(key)
+            # Derive key (cached for this instance's salt) and decrypt
+            cipher = self._get_cipher(salt)
             decrypted_bytes = cipher.decrypt(encrypted_bytes)
             
             return decrypted_bytes.decode('utf-8')
@@ -466,14 +534,89 @@ class DataEncryption:
 
 
 class AuditLogger:
-    """Comprehensive audit logging for critical operations."""
+    """
+    Comprehensive audit logging for critical operations.
     
-    def __init__(self):
+    When ``buffered`` is set and an event loop is running, events are
+    appended to a bounded in-memory buffer and written in batches by a
+    background task, so callers only pay for the append. Without a running
+    loop events are written immediately.
+    """
+    
+    def __init__(self, buffered: bool = False, max_buffered: int = 10000, batch_size: int = 64):
         self.logger = get_logger("audit")
         self.security_logger = get_logger("security")
+        
+        self.buffered = buffered
+        self.batch_size = batch_size
+        self.dropped_events = 0
+        self._buffer: deque = deque(maxlen=max_buffered)
+        self._flush_event: Optional[asyncio.Event] = None
+        self._flush_task: Optional[asyncio.Task] = None
     
     def log_audit_event(self, event: AuditEvent) -> None:
-        """Log an audit event."""
+        """Log an audit event, buffering it if enabled."""
+        if self.buffered and self._ensure_flush_task():
+            if len(self._buffer) == self._buffer.maxlen:
+                # Oldest event is evicted by the deque
+                self.dropped_events += 1
+            self._buffer.append(event)
+            self._flush_event.set()
+            return
+        
+        self._write_audit_event(event)
+    
+    def _ensure_flush_task(self) -> bool:
+        """Start the background flush task if a loop is running."""
+        if self._flush_task is not None and not self._flush_task.done():
+            return True
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        self._flush_event = asyncio.Event()
+        self._flush_task = asyncio.create_task(self._flush_loop())
+        return True
+    
+    async def _flush_loop(self) -> None:
+        """Write buffered events in batches as they arrive."""
+        while True:
+            try:
+                await self._flush_event.wait()
+                self._flush_event.clear()
+                while self._buffer:
+                    self._write_batch()
+                    # Let commands run between batches
+                    await asyncio.sleep(0)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self.logger.error(f"Error in audit flush task: {e}")
+    
+    def _write_batch(self) -> None:
+        """Write up to batch_size buffered events."""
+        for _ in range(min(self.batch_size, len(self._buffer))):
+            self._write_audit_event(self._buffer.popleft())
+    
+    async def flush(self) -> None:
+        """Write all buffered events and stop the background task."""
+        if self._flush_task and not self._flush_task.done():
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+        self._flush_task = None
+        
+        while self._buffer:
+            self._write_batch()
+        
+        if self.dropped_events:
+            self.logger.warning(f"Audit buffer overflowed, {self.dropped_events} events dropped")
+            self.dropped_events = 0
+    
+    def _write_audit_event(self, event: AuditEvent) -> None:
+        """Write an audit event to the audit and security logs."""
         try:
             # Create log context
             context = LogContext(
@@ -789,10 +932,18 @@ def get_audit_logger() -> AuditLogger:
     """Get global audit logger instance."""
     global _audit_logger
     if _audit_logger is None:
-        _audit_logger = AuditLogger()
+        _audit_logger = AuditLogger(buffered=True)
     return _audit_logger
 
 
+async def shutdown_audit_logger() -> None:
+    """Flush and release the global audit logger instance."""
+    global _audit_logger
+    if _audit_logger is not None:
+        await _audit_logger.flush()
+        _audit_logger = None
+
+
 def get_security_monitor() -> SecurityMonitor:
     """Get global security monitor instance."""
     global _security_monitor
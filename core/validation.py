@@ -8,13 +8,14 @@ data integrity, security, and proper input sanitization across the application.
 import re
 import html
 import functools
-from typing import Any, Dict, List, Optional, Union, Callable, Type, get_type_hints
+import operator
+from typing import Any, Dict, List, Optional, Sequence, Union, Callable, Type, get_type_hints
 from datetime import datetime, timedelta
 from decimal import Decimal, InvalidOperation
 from enum import Enum
 
 import discord
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from .exceptions import (
     ValidationError as CustomValidationError,
@@ -24,6 +25,55 @@ from .exceptions import (
 )
 
 
+# Marks a validated parameter that was not passed to the wrapped function
+_MISSING = object()
+
+# Valid Discord ID range: 17 to 20 decimal digits
+_DISCORD_ID_MIN = 10 ** 16
+_DISCORD_ID_MAX = 10 ** 20
+
+# Longest input sanitize_text scans; max_length is applied after sanitizing
+_MAX_SANITIZE_INPUT_LENGTH = 10_000
+
+# Longest accepted prediction question
+_MAX_QUESTION_LENGTH = 500
+
+# Control characters other than tab, newline and carriage return, for
+# str.translate
+_CONTROL_CHAR_TABLE = dict.fromkeys(
+    list(range(0x00, 0x09)) + [0x0B, 0x0C] + list(range(0x0E, 0x20)) + [0x7F]
+)
+
+# Duration strings: numbers with a week/day/hour/minute unit
+_DURATION_PART_PATTERN = re.compile(r'(\d+)([wdhm])')
+_DURATION_INVALID_CHAR_PATTERN = re.compile(r'[^\dwdhm]')
+_DURATION_UNIT_MINUTES = {'w': 7 * 24 * 60, 'd': 24 * 60, 'h': 60, 'm': 1}
+
+# Patterns used by the sanitizers, compiled once at import
+_HTML_TAG_PATTERN = re.compile(r'<[^>]*>')
+
+# Script content sanitize_text strips once tags are gone, as one
+# alternation: script schemes, inline handlers, alert() calls and script
+# fragments. Case-insensitive matching is slow at every position, so a
+# case-sensitive lookahead on the possible first letters (including the
+# long s that folds to 's') rejects most positions before the alternation
+# runs. Handler names are capped at 64 characters: an unbounded \w+ rescans
+# the rest of a long word from every "on" inside it, which is quadratic
+_SCRIPT_CONTENT_PATTERN = re.compile(
+    r'(?=[JjDdVvOoAaSs\u017f])'
+    r'(?i:javascript:|data:|vbscript:|on\w{1,64}\s*=|alert\([^)]*\)|script[^>]*)'
+)
+
+# Content rejected in prediction questions: SQL keywords, quotes or
+# semicolons, comment markers, and common injection payload functions and
+# tautologies; all checked in one scan
+_QUESTION_DANGEROUS_PATTERN = re.compile(
+    r'\b(?:select|insert|update|delete|drop|create|alter|exec|execute)\b|[\'";]|--|/\*'
+    r'|\b(?:sleep|benchmark|load_file)\s*\(|\binto\s+outfile\b|\bxp_cmdshell\b|\b1\s*=\s*1\b',
+    re.IGNORECASE
+)
+
+
 class ValidationSeverity(str, Enum):
     """Validation severity levels"""
     INFO = "info"
@@ -35,6 +85,8 @@ class ValidationSeverity(str, Enum):
 class ValidationResult:
     """Result of a validation operation"""
     
+    __slots__ = ('is_valid', 'errors', 'warnings', 'sanitized_data')
+    
     def __init__(self, is_valid: bool = True, errors: List[str] = None, 
                  warnings: List[str] = None, sanitized_data: Any = None):
         self.is_valid = is_valid
@@ -60,6 +112,68 @@ class ValidationResult:
         return len(self.warnings) > 0
 
 
+def _memoized_validator(func: Callable[..., ValidationResult]) -> Callable[..., ValidationResult]:
+    """
+    Cache a pure validator's results by argument.
+    
+    List arguments are keyed as tuples. Every call returns a fresh copy of
+    the cached result, so callers can still add errors or mutate the data.
+    """
+    cached = functools.lru_cache(maxsize=4096, typed=True)(func)
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        args = tuple(tuple(arg) if isinstance(arg, list) else arg for arg in args)
+        try:
+            result = cached(*args, **kwargs)
+        except TypeError:
+            # Unhashable argument; validate without caching
+            result = func(*args, **kwargs)
+        
+        sanitized_data = result.sanitized_data
+        if isinstance(sanitized_data, list):
+            sanitized_data = list(sanitized_data)
+        return ValidationResult(
+            is_valid=result.is_valid,
+            errors=list(result.errors),
+            warnings=list(result.warnings),
+            sanitized_data=sanitized_data
+        )
+    
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+def _strip_html_tags(text: str) -> str:
+    """
+    Remove HTML tags from text.
+    
+    Tags end with '>', so only the text up to the last '>' is scanned; a
+    run of '<' with no '>' after it would otherwise cost a scan to the end
+    of the text from each '<'.
+    """
+    end = text.rfind('>') + 1
+    return _HTML_TAG_PATTERN.sub('', text[:end]) + text[end:]
+
+
+@functools.lru_cache(maxsize=32)
+def _model_list_adapter(model_class: Type[BaseModel]) -> TypeAdapter:
+    """Build the list validator for a model once, not per batch."""
+    return TypeAdapter(List[model_class])
+
+
+@functools.lru_cache(maxsize=64, typed=True)
+def _bet_limit_error(bound: str, limit: int) -> str:
+    """
+    Format a bet limit error once per limit.
+    
+    Out-of-range int amounts skip the memoized validators, so repeated
+    rejected bets would otherwise format the same message every time.
+    """
+    return f"{bound} bet amount is {limit:,}"
+
+
 class Validator:
     """Static validation methods for various data types and business rules"""
     
@@ -105,36 +219,65 @@ class Validator:
         if not isinstance(text, str):
             text = str(text)
         
-        # Remove null bytes and control characters
-        text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)
+        # Bound the work (and any regex backtracking) before scanning;
+        # max_length applies to the sanitized text below
+        text = text[:_MAX_SANITIZE_INPUT_LENGTH]
         
-        # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
+        # Remove null bytes and control characters
+        text = text.translate(_CONTROL_CHAR_TABLE)
         
         if not allow_html:
-            # Remove HTML tags completely
-            text = re.sub(r'<[^>]*>', '', text)
-            
-            # Remove potential script content
-            for pattern in Validator.INJECTION_PATTERNS:
-                text = pattern.sub('', text)
-            
-            # Remove remaining script-related content
-            text = re.sub(r'alert\([^)]*\)', '', text, flags=re.IGNORECASE)
-            text = re.sub(r'script[^>]*', '', text, flags=re.IGNORECASE)
+            # Remove tags, then script content in a single pass. Matches
+            # become a space, so a removal cannot splice the letters around
+            # it into a new match (e.g. "javdata:ascript:")
+            text = _SCRIPT_CONTENT_PATTERN.sub(' ', _strip_html_tags(text))
         else:
             # Escape HTML entities
             text = html.escape(text)
         
+        # Normalize whitespace
+        text = ' '.join(text.split())
+        
         # Truncate if max_length specified
         if max_length and len(text) > max_length:
             text = text[:max_length].rstrip()
         
         return text
     
+    @staticmethod
+    def _sanitize_short_texts(texts: List[str]) -> List[str]:
+        """
+        Sanitize several short texts together, as sanitize_text(text) would
+        
+        The texts are normalized one by one, then scanned for tags and script
+        content in a single search over all of them; only when that finds
+        something does each text go through sanitize_text.
+        """
+        normalized = [' '.join(text.translate(_CONTROL_CHAR_TABLE).split()) for text in texts]
+        
+        # Any match inside one text is also found in the joined string;
+        # a match across a separator only costs the per-text fallback
+        joined = '\n'.join(normalized)
+        if '<' not in joined and not _SCRIPT_CONTENT_PATTERN.search(joined):
+            return normalized
+        
+        return [Validator.sanitize_text(text) for text in texts]
+    
     @staticmethod
     def validate_discord_id(discord_id: Union[str, int]) -> ValidationResult:
         """Validate Discord ID format"""
+        # Fast path: plain ints only need the 17-20 digit range check
+        if type(discord_id) is int:
+            if _DISCORD_ID_MIN <= discord_id < _DISCORD_ID_MAX:
+                return ValidationResult(sanitized_data=discord_id)
+            return ValidationResult(is_valid=False, errors=["Invalid Discord ID format"])
+        
+        return Validator._validate_discord_id_text(discord_id)
+    
+    @staticmethod
+    @_memoized_validator
+    def _validate_discord_id_text(discord_id: Union[str, int]) -> ValidationResult:
+        """Validate a Discord ID given as text (or any non-int value)"""
         result = ValidationResult()
         
         try:
@@ -156,6 +299,7 @@ class Validator:
         return result
     
     @staticmethod
+    @_memoized_validator
     def validate_prediction_question(question: str) -> ValidationResult:
         """Validate prediction question"""
         result = ValidationResult()
@@ -170,21 +314,13 @@ class Validator:
         if len(sanitized) < 10:
             result.add_error("Question must be at least 10 characters long")
         
-        if len(sanitized) > 500:
-            result.add_error("Question cannot exceed 500 characters")
-            sanitized = sanitized[:500]
+        if len(sanitized) > _MAX_QUESTION_LENGTH:
+            result.add_error(f"Question cannot exceed {_MAX_QUESTION_LENGTH} characters")
+            sanitized = sanitized[:_MAX_QUESTION_LENGTH]
         
         # Check for injection attempts (be more specific about what constitutes dangerous content)
-        dangerous_patterns = [
-            re.compile(r'\b(select|insert|update|delete|drop|create|alter|exec|execute)\b', re.IGNORECASE),
-            re.compile(r'[\'";]', re.IGNORECASE),
-            re.compile(r'--', re.IGNORECASE),
-        ]
-        
-        for pattern in dangerous_patterns:
-            if pattern.search(sanitized):
-                result.add_error("Question contains potentially dangerous content")
-                break
+        if _QUESTION_DANGEROUS_PATTERN.search(sanitized):
+            result.add_error("Question contains potentially dangerous content")
         
         # Ensure question ends with question mark
         if not sanitized.endswith('?'):
@@ -195,6 +331,7 @@ class Validator:
         return result
     
     @staticmethod
+    @_memoized_validator
     def validate_prediction_options(options: List[str]) -> ValidationResult:
         """Validate prediction options"""
         result = ValidationResult()
@@ -207,20 +344,32 @@ class Validator:
             result.add_error("Maximum 10 options allowed")
             return result
         
+        # Strip and length-check each option first, keeping any error so
+        # errors are still reported in option order below
+        checked_options = []
+        for option in options:
+            stripped = option.strip() if option else ''
+            if not stripped:
+                checked_options.append((None, "Option cannot be empty"))
+            elif len(stripped) > 100:
+                # Check length before sanitization
+                checked_options.append((None, "Option cannot exceed 100 characters"))
+            else:
+                checked_options.append((stripped, None))
+        
+        # Already within the limit, and sanitizing never lengthens text
+        sanitized_batch = iter(Validator._sanitize_short_texts(
+            [stripped for stripped, error in checked_options if error is None]
+        ))
+        
         sanitized_options = []
         seen_options = set()
         
-        for option in options:
-            if not option or not option.strip():
-                result.add_error("Option cannot be empty")
-                continue
-            
-            # Check length before sanitization
-            if len(option.strip()) > 100:
-                result.add_error("Option cannot exceed 100 characters")
+        for _, error in checked_options:
+            if error is not None:
+                result.add_error(error)
                 continue
-            
-            sanitized = Validator.sanitize_text(option, max_length=100)
+            sanitized = next(sanitized_batch)
             
             if len(sanitized) < 1:
                 result.add_error("Option cannot be empty after sanitization")
@@ -245,8 +394,17 @@ class Validator:
     def validate_bet_amount(amount: Union[str, int, float], min_amount: int = 1, 
                           max_amount: int = 1_000_000) -> ValidationResult:
         """Validate bet amount"""
-        result = ValidationResult()
+        # Fast path: plain ints only need the range checks
+        if type(amount) is int:
+            return Validator._check_bet_amount_range(amount, min_amount, max_amount)
         
+        return Validator._validate_bet_amount_value(amount, min_amount, max_amount)
+    
+    @staticmethod
+    @_memoized_validator
+    def _validate_bet_amount_value(amount: Union[str, int, float], min_amount: int,
+                                   max_amount: int) -> ValidationResult:
+        """Validate a bet amount given as text, a float or an int subclass"""
         try:
             if isinstance(amount, str):
                 # Remove common formatting
@@ -256,23 +414,27 @@ class Validator:
                 amount = int(amount)
             
             if not isinstance(amount, int):
-                result.add_error("Amount must be a valid integer")
-                return result
+                return ValidationResult(is_valid=False, errors=["Amount must be a valid integer"])
             
+            return Validator._check_bet_amount_range(amount, min_amount, max_amount)
+            
+        except (ValueError, TypeError):
+            return ValidationResult(is_valid=False, errors=["Amount must be a valid number"])
+    
+    @staticmethod
+    def _check_bet_amount_range(amount: int, min_amount: int, max_amount: int) -> ValidationResult:
+        """Check an integer bet amount against the allowed range"""
+        result = ValidationResult()
+        
+        try:
             if amount <= 0:
                 result.add_error("Amount must be positive")
-                return result
-            
-            if amount < min_amount:
-                result.add_error(f"Minimum bet amount is {min_amount:,}")
-                return result
-            
-            if amount > max_amount:
-                result.add_error(f"Maximum bet amount is {max_amount:,}")
-                return result
-            
-            result.sanitized_data = amount
-            
+            elif amount < min_amount:
+                result.add_error(_bet_limit_error("Minimum", min_amount))
+            elif amount > max_amount:
+                result.add_error(_bet_limit_error("Maximum", max_amount))
+            else:
+                result.sanitized_data = amount
         except (ValueError, TypeError):
             result.add_error("Amount must be a valid number")
         
@@ -280,8 +442,33 @@ class Validator:
     
     @staticmethod
     def validate_duration(duration_str: str, min_minutes: int = 5, 
-                         max_hours: int = 720) -> ValidationResult:
-        """Validate and parse duration string"""
+                         max_hours: int = 720, *,
+                         now: Optional[datetime] = None) -> ValidationResult:
+        """
+        Validate and parse duration string
+        
+        Args:
+            duration_str: Duration such as "2h" or "3d 2h"
+            min_minutes: Shortest accepted duration
+            max_hours: Longest accepted duration
+            now: Naive UTC start time; callers validating several durations
+                for one request can pass a shared value instead of reading
+                the clock on every call
+        """
+        result = Validator._parse_duration(duration_str, min_minutes, max_hours)
+        
+        # Parsing is cached; the end time is always computed from now
+        if result.is_valid:
+            if now is None:
+                now = datetime.utcnow()
+            result.sanitized_data = now + timedelta(minutes=result.sanitized_data)
+        
+        return result
+    
+    @staticmethod
+    @_memoized_validator
+    def _parse_duration(duration_str: str, min_minutes: int, max_hours: int) -> ValidationResult:
+        """Parse a duration string into total minutes"""
         result = ValidationResult()
         
         if not duration_str or not duration_str.strip():
@@ -292,27 +479,17 @@ class Validator:
             # Parse duration string (e.g., "2h", "1d", "3d 2h", "1w")
             duration_str = duration_str.replace(" ", "").lower()
             
-            total_minutes = 0
-            current_number = ""
+            invalid_char = _DURATION_INVALID_CHAR_PATTERN.search(duration_str)
+            if invalid_char:
+                result.add_error(f"Invalid character in duration: {invalid_char.group()}")
+                return result
             
-            for char in duration_str:
-                if char.isdigit():
-                    current_number += char
-                elif char in ['w', 'd', 'h', 'm']:
-                    if current_number:
-                        num = int(current_number)
-                        if char == 'w':  # weeks
-                            total_minutes += num * 7 * 24 * 60
-                        elif char == 'd':  # days
-                            total_minutes += num * 24 * 60
-                        elif char == 'h':  # hours
-                            total_minutes += num * 60
-                        elif char == 'm':  # minutes
-                            total_minutes += num
-                        current_number = ""
-                else:
-                    result.add_error(f"Invalid character in duration: {char}")
-                    return result
+            # Each number followed by a unit adds to the total; stray
+            # numbers or units contribute nothing
+            total_minutes = sum(
+                int(number) * _DURATION_UNIT_MINUTES[unit]
+                for number, unit in _DURATION_PART_PATTERN.findall(duration_str)
+            )
             
             if total_minutes < min_minutes:
                 result.add_error(f"Duration must be at least {min_minutes} minutes")
@@ -322,8 +499,7 @@ class Validator:
                 result.add_error(f"Duration cannot exceed {max_hours} hours")
                 return result
             
-            end_time = datetime.utcnow() + timedelta(minutes=total_minutes)
-            result.sanitized_data = end_time
+            result.sanitized_data = total_minutes
             
         except (ValueError, TypeError):
             result.add_error("Invalid duration format. Use formats like: '2h', '1d', '3d 2h', '1w'")
@@ -331,6 +507,7 @@ class Validator:
         return result
     
     @staticmethod
+    @_memoized_validator
     def validate_category(category: str) -> ValidationResult:
         """Validate prediction category"""
         result = ValidationResult()
@@ -375,6 +552,7 @@ class Validator:
         return result
     
     @staticmethod
+    @_memoized_validator
     def validate_prediction_id(prediction_id: str) -> ValidationResult:
         """Validate prediction ID format"""
         result = ValidationResult()
@@ -398,7 +576,7 @@ class Validator:
         result = ValidationResult()
         
         try:
-            validated_model = model_class(**data)
+            validated_model = model_class.model_validate(data)
             result.sanitized_data = validated_model
         except ValidationError as e:
             for error in e.errors():
@@ -408,6 +586,27 @@ class Validator:
             result.add_error(f"Validation error: {str(e)}")
         
         return result
+    
+    @staticmethod
+    def validate_pydantic_models(model_class: Type[BaseModel],
+                                 items: List[Dict[str, Any]]) -> ValidationResult:
+        """
+        Validate a batch of dicts against a Pydantic model in one call
+        
+        Error paths start with the item's index (e.g. "2 -> amount: ...").
+        """
+        result = ValidationResult()
+        
+        try:
+            result.sanitized_data = _model_list_adapter(model_class).validate_python(items)
+        except ValidationError as e:
+            for error in e.errors():
+                field_path = " -> ".join(str(loc) for loc in error['loc'])
+                result.add_error(f"{field_path}: {error['msg']}")
+        except Exception as e:
+            result.add_error(f"Validation error: {str(e)}")
+        
+        return result
 
 
 def validate_input(**validators):
@@ -423,119 +622,77 @@ def validate_input(**validators):
             pass
     """
     def decorator(func):
-        @functools.wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            # Get function signature
-            sig = func.__annotations__
-            param_names = list(func.__code__.co_varnames[:func.__code__.co_argcount])
-            
-            # Handle 'self' parameter for method calls
-            original_args = args
-            is_method = param_names and param_names[0] == 'self'
-            
-            if is_method:
-                param_names = param_names[1:]  # Remove 'self' from param names
-                validation_args = args[1:]     # Remove 'self' from args for validation
-            else:
-                validation_args = args
-            
-            # Create parameter mapping
-            params = dict(zip(param_names, validation_args))
-            params.update(kwargs)
-            
-            # Validate each specified parameter
-            validation_errors = []
-            sanitized_params = {}
-            
-            for param_name, validator_func in validators.items():
-                if param_name in params:
-                    try:
-                        validation_result = validator_func(params[param_name])
-                        if validation_result.has_errors():
-                            validation_errors.extend([
-                                f"{param_name}: {error}" for error in validation_result.errors
-                            ])
-                        else:
-                            # Use sanitized data if available
-                            if validation_result.sanitized_data is not None:
-                                sanitized_params[param_name] = validation_result.sanitized_data
-                            else:
-                                sanitized_params[param_name] = params[param_name]
-                    except Exception as e:
-                        validation_errors.append(f"{param_name}: Validation error - {str(e)}")
-                else:
-                    # Parameter not provided but validator specified
-                    validation_errors.append(f"{param_name}: Required parameter missing")
-            
-            if validation_errors:
-                raise CustomValidationError(
-                    "Input validation failed",
-                    details={"validation_errors": validation_errors}
-                )
+        # Resolve parameter positions once; 'self' is skipped for methods
+        param_names = list(func.__code__.co_varnames[:func.__code__.co_argcount])
+        offset = 1 if param_names and param_names[0] == 'self' else 0
+        param_names = param_names[offset:]
+        specs = tuple(
+            (
+                param_names.index(param_name) + offset if param_name in param_names else None,
+                param_name,
+                validator_func
+            )
+            for param_name, validator_func in validators.items()
+        )
+        
+        # When every validated parameter is passed positionally, all values
+        # are fetched with one itemgetter call instead of per-name lookups
+        positions = [position for position, _, _ in specs]
+        if specs and None not in positions:
+            min_args = max(positions) + 1
+            # itemgetter returns a bare value rather than a tuple for one key
+            get_positional = operator.itemgetter(*positions) if len(positions) > 1 else (
+                lambda args: (args[positions[0]],)
+            )
+        else:
+            min_args = None
+        
+        def collect_values(args: tuple, kwargs: dict) -> Sequence[Any]:
+            """Look up the value passed for each validated parameter"""
+            if not kwargs and min_args is not None and len(args) >= min_args:
+                return get_positional(args)
             
-            # Update kwargs with sanitized values
-            for param_name, sanitized_value in sanitized_params.items():
+            values = []
+            for position, param_name, _ in specs:
                 if param_name in kwargs:
-                    kwargs[param_name] = sanitized_value
+                    values.append(kwargs[param_name])
+                elif position is not None and position < len(args):
+                    values.append(args[position])
                 else:
-                    # Find position in validation_args and update
-                    try:
-                        param_index = param_names.index(param_name)
-                        if param_index < len(validation_args):
-                            validation_args = list(validation_args)
-                            validation_args[param_index] = sanitized_value
-                            validation_args = tuple(validation_args)
-                    except (ValueError, IndexError):
-                        pass
-            
-            # Reconstruct args with 'self' if it's a method
-            if is_method:
-                final_args = (original_args[0],) + validation_args
-            else:
-                final_args = validation_args
-            
-            return await func(*final_args, **kwargs)
+                    values.append(_MISSING)
+            return values
         
-        @functools.wraps(func)
-        def sync_wrapper(*args, **kwargs):
-            # Similar logic for sync functions
-            sig = func.__annotations__
-            param_names = list(func.__code__.co_varnames[:func.__code__.co_argcount])
-            
-            # Handle 'self' parameter for method calls
-            original_args = args
-            is_method = param_names and param_names[0] == 'self'
-            
-            if is_method:
-                param_names = param_names[1:]  # Remove 'self' from param names
-                validation_args = args[1:]     # Remove 'self' from args for validation
-            else:
-                validation_args = args
-            
-            # Create parameter mapping
-            params = dict(zip(param_names, validation_args))
-            params.update(kwargs)
-            
+        def validate_arguments(args: tuple, kwargs: dict) -> tuple:
+            """Validate arguments and return args with sanitized values substituted"""
             validation_errors = []
-            sanitized_params = {}
+            sanitized_args = None
             
-            for param_name, validator_func in validators.items():
-                if param_name in params:
-                    try:
-                        validation_result = validator_func(params[param_name])
-                        if validation_result.has_errors():
-                            validation_errors.extend([
-                                f"{param_name}: {error}" for error in validation_result.errors
-                            ])
-                        else:
-                            if validation_result.sanitized_data is not None:
-                                sanitized_params[param_name] = validation_result.sanitized_data
-                            else:
-                                sanitized_params[param_name] = params[param_name]
-                    except Exception as e:
-                        validation_errors.append(f"{param_name}: Validation error - {str(e)}")
-                else:
+            for (position, param_name, validator_func), value in zip(specs, collect_values(args, kwargs)):
+                if value is _MISSING:
+                    # Parameter not provided but validator specified
                     validation_errors.append(f"{param_name}: Required parameter missing")
+                    continue
+                
+                try:
+                    validation_result = validator_func(value)
+                except Exception as e:
+                    validation_errors.append(f"{param_name}: Validation error - {str(e)}")
+                    continue
+                
+                if validation_result.has_errors():
+                    validation_errors.extend([
+                        f"{param_name}: {error}" for error in validation_result.errors
+                    ])
+                    continue
+                
+                # Use sanitized data if available
+                if validation_result.sanitized_data is not None:
+                    if param_name in kwargs:
+                        kwargs[param_name] = validation_result.sanitized_data
+                    else:
+                        if sanitized_args is None:
+                            sanitized_args = list(args)
+                        sanitized_args[position] = validation_result.sanitized_data
             
             if validation_errors:
                 raise CustomValidationError(
@@ -543,34 +700,28 @@ def validate_input(**validators):
                     details={"validation_errors": validation_errors}
                 )
             
-            # Update kwargs with sanitized values
-            for param_name, sanitized_value in sanitized_params.items():
-                if param_name in kwargs:
-                    kwargs[param_name] = sanitized_value
-                else:
-                    # Find position in validation_args and update
-                    try:
-                        param_index = param_names.index(param_name)
-                        if param_index < len(validation_args):
-                            validation_args = list(validation_args)
-                            validation_args[param_index] = sanitized_value
-                            validation_args = tuple(validation_args)
-                    except (ValueError, IndexError):
-                        pass
-            
-            # Reconstruct args with 'self' if it's a method
-            if is_method:
-                final_args = (original_args[0],) + validation_args
-            else:
-                final_args = validation_args
-            
-            return func(*final_args, **kwargs)
+            return args if sanitized_args is None else tuple(sanitized_args)
         
-        # Return appropriate wrapper based on function type
+        # Pick the wrapper once based on function type. Validators always run
+        # synchronously, but coroutine functions still get an async wrapper:
+        # a plain function returning func's coroutine would no longer pass
+        # asyncio.iscoroutinefunction (which discord.py and the middleware
+        # rely on), and validation errors would be raised at call time
+        # rather than when the call is awaited
         if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                args = validate_arguments(args, kwargs)
+                return await func(*args, **kwargs)
+            
             return async_wrapper
-        else:
-            return sync_wrapper
+        
+        @functools.wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            args = validate_arguments(args, kwargs)
+            return func(*args, **kwargs)
+        
+        return sync_wrapper
     
     return decorator
 
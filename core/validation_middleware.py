@@ -7,8 +7,8 @@ implementing rate limiting, permission checks, and input sanitization.
 
 import asyncio
 import time
-from typing import Dict, List, Optional, Callable, Any, Union
-from collections import defaultdict, deque
+from typing import Dict, List, Optional, Callable, Any, Sequence, Tuple, Union
+from collections import deque
 from datetime import datetime, timedelta
 
 import discord
@@ -26,9 +26,11 @@ class RateLimiter:
     """Rate limiting implementation with sliding window algorithm"""
     
     def __init__(self):
-        self.requests: Dict[str, deque] = defaultdict(deque)
+        # Each key keeps at most its limit's worth of timestamps, so the
+        # oldest one alone decides whether a new request fits the window
+        self.requests: Dict[str, deque] = {}
         self.cleanup_interval = 300  # 5 minutes
-        self.last_cleanup = time.time()
+        self.last_cleanup = time.monotonic()
     
     async def check_rate_limit(self, key: str, limit: int, window_seconds: int) -> bool:
         """
@@ -42,32 +44,33 @@ class RateLimiter:
         Returns:
             True if request is allowed, False if rate limited
         """
-        now = time.time()
+        now = time.monotonic()
         
         # Cleanup old entries periodically
         if now - self.last_cleanup > self.cleanup_interval:
             await self._cleanup_old_entries()
             self.last_cleanup = now
         
-        # Get request history for this key
-        request_times = self.requests[key]
+        if limit <= 0:
+            return False
         
-        # Remove requests outside the window
-        cutoff_time = now - window_seconds
-        while request_times and request_times[0] < cutoff_time:
-            request_times.popleft()
+        # Get request history for this key
+        request_times = self.requests.get(key)
+        if request_times is None or request_times.maxlen != limit:
+            request_times = self.requests[key] = deque(request_times or (), maxlen=limit)
         
-        # Check if limit exceeded
-        if len(request_times) >= limit:
+        # Limit exceeded if the oldest of the last `limit` requests is still
+        # inside the window
+        if len(request_times) >= limit and request_times[0] >= now - window_seconds:
             return False
         
-        # Add current request
+        # Add current request; a full deque drops its oldest entry
         request_times.append(now)
         return True
     
     async def _cleanup_old_entries(self):
         """Remove old rate limit entries to prevent memory leaks"""
-        now = time.time()
+        now = time.monotonic()
         keys_to_remove = []
         
         for key, request_times in self.requests.items():
@@ -85,13 +88,13 @@ class RateLimiter:
     
     def get_remaining_time(self, key: str, window_seconds: int) -> int:
         """Get remaining time until rate limit resets"""
-        request_times = self.requests.get(key, deque())
+        request_times = self.requests.get(key)
         if not request_times:
             return 0
         
         oldest_request = request_times[0]
         reset_time = oldest_request + window_seconds
-        remaining = max(0, reset_time - time.time())
+        remaining = max(0, reset_time - time.monotonic())
         return int(remaining)
 
 
@@ -189,6 +192,10 @@ class ValidationMiddleware:
             sanitize_inputs: Whether to sanitize string inputs
         """
         def decorator(func):
+            # Resolve the validated parameters once, not on every invocation
+            param_names = self._command_param_names(func)
+            validation_items = tuple(input_validation.items()) if input_validation else ()
+            
             async def wrapper(cog_self, interaction: discord.Interaction, *args, **kwargs):
                 try:
                     # 1. Rate Limiting
@@ -202,7 +209,7 @@ class ValidationMiddleware:
                     # 3. Input Validation and Sanitization
                     if input_validation or sanitize_inputs:
                         args, kwargs = await self._validate_inputs(
-                            func, args, kwargs, input_validation, sanitize_inputs
+                            param_names, args, kwargs, validation_items, sanitize_inputs
                         )
                     
                     # 4. Execute the command
@@ -286,12 +293,10 @@ class ValidationMiddleware:
                 required_permission="custom_check"
             )
     
-    async def _validate_inputs(self, func: Callable, args: tuple, kwargs: dict,
-                             validation_config: Dict[str, Callable] = None,
-                             sanitize_inputs: bool = True) -> tuple:
-        """Validate and sanitize function inputs"""
-        # Get parameter names
-        param_names = list(func.__code__.co_varnames[:func.__code__.co_argcount])
+    @staticmethod
+    def _command_param_names(func: Callable) -> Tuple[str, ...]:
+        """Get a command's parameter names after 'self' and 'interaction'"""
+        param_names = func.__code__.co_varnames[:func.__code__.co_argcount]
         
         # Skip 'self' and 'interaction' parameters
         if param_names and param_names[0] == 'self':
@@ -299,6 +304,12 @@ class ValidationMiddleware:
         if param_names and param_names[0] == 'interaction':
             param_names = param_names[1:]
         
+        return param_names
+    
+    async def _validate_inputs(self, param_names: Sequence[str], args: tuple, kwargs: dict,
+                             validation_items: Sequence[Tuple[str, Callable]] = (),
+                             sanitize_inputs: bool = True) -> tuple:
+        """Validate and sanitize function inputs"""
         # Create parameter mapping
         params = dict(zip(param_names, args))
         params.update(kwargs)
@@ -307,8 +318,8 @@ class ValidationMiddleware:
         sanitized_params = {}
         
         # Apply custom validation
-        if validation_config:
-            for param_name, validator_func in validation_config.items():
+        if validation_items:
+            for param_name, validator_func in validation_items:
                 if param_name in params:
                     try:
                         result = validator_func(params[param_name])
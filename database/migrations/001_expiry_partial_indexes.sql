@@ -0,0 +1,29 @@
+-- Partial covering indexes for the background expiry scans in
+-- PredictionDatabase.get_expired_predictions and
+-- PredictionDatabase.get_predictions_for_auto_refund.
+--
+-- Each index only contains live markets matching the query predicate, so it
+-- stays small, and INCLUDE lets the planner answer the scan from the index.
+--
+-- Verify with:
+--   EXPLAIN (ANALYZE, BUFFERS)
+--   SELECT id, guild_id, question, creator_id, end_time FROM predictions
+--   WHERE status = 'active' AND end_time <= NOW();
+--
+--   EXPLAIN (ANALYZE, BUFFERS)
+--   SELECT id, guild_id, question, creator_id FROM predictions
+--   WHERE status = 'ended' AND end_time <= NOW() - make_interval(hours => 120)
+--   AND NOT resolved;
+
+-- Superseded by idx_predictions_active_end_time below
+DROP INDEX IF EXISTS idx_predictions_end_time;
+
+CREATE INDEX IF NOT EXISTS idx_predictions_active_end_time
+    ON predictions (end_time)
+    INCLUDE (id, guild_id, creator_id, question)
+    WHERE status = 'active';
+
+CREATE INDEX IF NOT EXISTS idx_predictions_ended_unresolved_end_time
+    ON predictions (end_time)
+    INCLUDE (id, guild_id, creator_id, question)
+    WHERE status = 'ended' AND NOT resolved;
@@ -0,0 +1,33 @@
+-- Make predictions.k_constant a stored generated column so the AMM constant
+-- is always initial_liquidity^2 and no longer has to be sent on every insert
+-- (see PredictionDatabase.create_prediction).
+--
+-- An existing column cannot be converted in place, so it is dropped and
+-- re-added. active_predictions selects p.* and has to be dropped around the
+-- change. Its definition differs between supabase_schema.sql and
+-- supabase_schema_enhanced.sql, so the installed definition is saved and
+-- recreated as-is. Any other view on k_constant makes the DROP COLUMN fail
+-- and rolls the migration back.
+
+BEGIN;
+
+DO $$
+DECLARE
+    view_definition TEXT;
+BEGIN
+    IF to_regclass('active_predictions') IS NOT NULL THEN
+        view_definition := pg_get_viewdef('active_predictions'::regclass);
+        DROP VIEW active_predictions;
+    END IF;
+
+    ALTER TABLE predictions DROP COLUMN k_constant;
+    ALTER TABLE predictions
+        ADD COLUMN k_constant BIGINT
+        GENERATED ALWAYS AS (initial_liquidity::BIGINT * initial_liquidity) STORED;
+
+    IF view_definition IS NOT NULL THEN
+        EXECUTE 'CREATE VIEW active_predictions AS ' || view_definition;
+    END IF;
+END $$;
+
+COMMIT;
@@ -0,0 +1,37 @@
+-- Fuse bet placement and liquidity pool updates into a single server-side call
+-- (see PredictionDatabase.place_bet_atomic). Replaces one INSERT plus one
+-- UPDATE per option, each on its own pooled connection, with one statement.
+
+-- Place a bet and move both liquidity pools in one round trip and transaction
+CREATE OR REPLACE FUNCTION place_bet_atomic(
+    p_prediction_id UUID,
+    p_user_id BIGINT,
+    p_guild_id BIGINT,
+    p_option_name TEXT,
+    p_amount_bet INTEGER,
+    p_shares_owned DECIMAL,
+    p_price_per_share DECIMAL,
+    p_pool_options TEXT[],
+    p_pool_liquidity INTEGER[]
+)
+RETURNS UUID AS $$
+DECLARE
+    bet_id UUID;
+BEGIN
+    INSERT INTO bets (
+        prediction_id, user_id, guild_id, option_name,
+        amount_bet, shares_owned, price_per_share
+    ) VALUES (
+        p_prediction_id, p_user_id, p_guild_id, p_option_name,
+        p_amount_bet, p_shares_owned, p_price_per_share
+    )
+    RETURNING id INTO bet_id;
+    
+    UPDATE liquidity_pools lp
+    SET current_liquidity = pool.liquidity, updated_at = NOW()
+    FROM unnest(p_pool_options, p_pool_liquidity) AS pool(option_name, liquidity)
+    WHERE lp.prediction_id = p_prediction_id AND lp.option_name = pool.option_name;
+    
+    RETURN bet_id;
+END;
+$$ LANGUAGE plpgsql;
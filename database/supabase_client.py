@@ -1,5 +1,6 @@
 import os
 import asyncio
+from contextlib import asynccontextmanager
 from typing import List, Dict, Optional, Tuple, Any
 from datetime import datetime, timedelta
 import asyncpg
@@ -16,23 +17,31 @@ class SupabaseManager:
         self.db_url = db_url
         self.pool: Optional[asyncpg.Pool] = None
         
-    async def initialize(self):
-        """Initialize the database connection pool"""
+    async def initialize(self, min_size: int = 5, max_size: int = 20, command_timeout: float = 60):
+        """Initialize the asyncpg connection pool used for all queries"""
         self.pool = await asyncpg.create_pool(
             self.db_url,
-            min_size=5,
-            max_size=20,
-            command_timeout=60
+            min_size=min_size,
+            max_size=max_size,
+            command_timeout=command_timeout
         )
         
-    async def cleanup(self):
-        """Cleanup database connections"""
+    async def cleanup(self, timeout: float = 10.0):
+        """Cleanup database connections.
+
+        Waits up to ``timeout`` seconds for in-flight queries to finish, then
+        terminates the pool so shutdown can never hang on a busy connection.
+        """
         if self.pool:
-            await self.pool.close()
+            try:
+                await asyncio.wait_for(self.pool.close(), timeout=timeout)
+            except asyncio.TimeoutError:
+                print(f"Database pool did not close within {timeout}s, terminating connections")
+                self.pool.terminate()
             
     async def ensure_guild_exists(self, guild_id: int, guild_name: str):
         """Ensure guild exists in database"""
-        async with self.pool.acquire() as conn:
+        async with self.pool.acquire(timeout=5.0) as conn:
             await conn.execute("""
                 INSERT INTO guilds (id, name) 
                 VALUES ($1, $2) 
@@ -42,8 +51,27 @@ class SupabaseManager:
             """, guild_id, guild_name)
 
 class PredictionDatabase:
-    def __init__(self, supabase_manager: SupabaseManager):
+    def __init__(self, supabase_manager: SupabaseManager, acquire_timeout: float = 5.0):
         self.db = supabase_manager
+        self.acquire_timeout = acquire_timeout
+        # Number of times a connection could not be acquired in time
+        self.acquire_timeouts = 0
+
+    @asynccontextmanager
+    async def _conn(self, timeout: Optional[float] = None):
+        """Acquire a pooled connection, failing fast if the pool is exhausted"""
+        pool = self.db.pool
+        try:
+            conn = await pool.acquire(
+                timeout=self.acquire_timeout if timeout is None else timeout
+            )
+        except asyncio.TimeoutError:
+            self.acquire_timeouts += 1
+            raise
+        try:
+            yield conn
+        finally:
+            await pool.release(conn)
         
     async def create_prediction(
         self, 
@@ -56,23 +84,23 @@ class PredictionDatabase:
         initial_liquidity: int = 30000
     ) -> str:
         """Create a new prediction market"""
-        async with self.db.pool.acquire() as conn:
+        async with self._conn() as conn:
             async with conn.transaction():
                 # Insert prediction
                 prediction_id = await conn.fetchval("""
                     INSERT INTO predictions (
                         guild_id, question, options, creator_id, 
-                        end_time, category, initial_liquidity, k_constant
-                    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+                        end_time, category, initial_liquidity
+                    ) VALUES ($1, $2, $3, $4, $5, $6, $7)
                     RETURNING id
                 """, guild_id, question, options, creator_id, 
-                    end_time, category, initial_liquidity, initial_liquidity ** 2)
+                    end_time, category, initial_liquidity)
                 
                 return str(prediction_id)
     
-    async def get_active_predictions(self, guild_id: int) -> List[Dict]:
+    async def get_active_predictions(self, guild_id: int) -> List[asyncpg.Record]:
         """Get all active predictions for a guild"""
-        async with self.db.pool.acquire() as conn:
+        async with self._conn() as conn:
             rows = await conn.fetch("""
                 SELECT p.*, 
                        json_agg(
@@ -88,11 +116,11 @@ class PredictionDatabase:
                 ORDER BY p.created_at DESC
             """, guild_id)
             
-            return [dict(row) for row in rows]
+            return rows
     
-    async def get_prediction_by_id(self, prediction_id: str) -> Optional[Dict]:
+    async def get_prediction_by_id(self, prediction_id: str) -> Optional[asyncpg.Record]:
         """Get prediction by ID with all related data"""
-        async with self.db.pool.acquire() as conn:
+        async with self._conn() as conn:
             row = await conn.fetchrow("""
                 SELECT p.*,
                        json_agg(
@@ -107,7 +135,7 @@ class PredictionDatabase:
                 GROUP BY p.id
             """, prediction_id)
             
-            return dict(row) if row else None
+            return row
     
     async def place_bet(
         self,
@@ -120,7 +148,7 @@ class PredictionDatabase:
         price_per_share: float
     ) -> bool:
         """Place a bet and update liquidity pools atomically"""
-        async with self.db.pool.acquire() as conn:
+        async with self._conn() as conn:
             async with conn.transaction():
                 try:
                     # Insert bet
@@ -137,6 +165,36 @@ class PredictionDatabase:
                     print(f"Error placing bet: {e}")
                     return False
     
+    async def place_bet_atomic(
+        self,
+        prediction_id: str,
+        user_id: int,
+        guild_id: int,
+        option_name: str,
+        amount_bet: int,
+        shares_owned: float,
+        price_per_share: float,
+        liquidity_updates: Dict[str, int]
+    ) -> Optional[str]:
+        """Place a bet and set the new liquidity pools in one round trip.
+
+        Runs the ``place_bet_atomic`` database function, so the bet insert and
+        every pool update commit or roll back together. Returns the bet ID, or
+        None if the bet could not be placed.
+        """
+        async with self._conn() as conn:
+            try:
+                bet_id = await conn.fetchval("""
+                    SELECT place_bet_atomic($1, $2, $3, $4, $5, $6, $7, $8, $9)
+                """, prediction_id, user_id, guild_id, option_name,
+                    amount_bet, shares_owned, price_per_share,
+                    list(liquidity_updates.keys()), list(liquidity_updates.values()))
+                
+                return str(bet_id)
+            except Exception as e:
+                print(f"Error placing bet: {e}")
+                return None
+    
     async def update_liquidity_pool(
         self,
         prediction_id: str,
@@ -144,7 +202,7 @@ class PredictionDatabase:
         new_liquidity: int
     ):
         """Update liquidity pool for an option"""
-        async with self.db.pool.acquire() as conn:
+        async with self._conn() as conn:
             await conn.execute("""
                 UPDATE liquidity_pools 
                 SET current_liquidity = $3, updated_at = NOW()
@@ -155,24 +213,24 @@ class PredictionDatabase:
         self, 
         prediction_id: str, 
         user_id: int
-    ) -> List[Dict]:
+    ) -> List[asyncpg.Record]:
         """Get all bets by a user for a specific prediction"""
-        async with self.db.pool.acquire() as conn:
+        async with self._conn() as conn:
             rows = await conn.fetch("""
                 SELECT * FROM bets 
                 WHERE prediction_id = $1 AND user_id = $2
                 ORDER BY created_at DESC
             """, prediction_id, user_id)
             
-            return [dict(row) for row in rows]
+            return rows
     
     async def get_option_bets(
         self, 
         prediction_id: str, 
         option_name: str
-    ) -> List[Dict]:
+    ) -> List[asyncpg.Record]:
         """Get all bets for a specific option"""
-        async with self.db.pool.acquire() as conn:
+        async with self._conn() as conn:
             rows = await conn.fetch("""
                 SELECT user_id, SUM(amount_bet) as total_amount, SUM(shares_owned) as total_shares
                 FROM bets 
@@ -180,11 +238,51 @@ class PredictionDatabase:
                 GROUP BY user_id
             """, prediction_id, option_name)
             
-            return [dict(row) for row in rows]
-    
+            return rows
+
+    async def get_bet_aggregates(self, prediction_id: str) -> Dict[str, Any]:
+        """Get per-user/option, per-user and per-option bet totals in one scan.
+
+        Uses GROUPING SETS so Postgres computes all three aggregations from a
+        single pass over the prediction's bets. Rows are split by which
+        grouping columns are NULL (both columns are NOT NULL in ``bets``).
+        """
+        async with self._conn() as conn:
+            rows = await conn.fetch("""
+                SELECT user_id, option_name,
+                       SUM(amount_bet) as total_amount,
+                       SUM(shares_owned) as total_shares
+                FROM bets
+                WHERE prediction_id = $1
+                GROUP BY GROUPING SETS ((user_id, option_name), (user_id), (option_name))
+            """, prediction_id)
+
+            aggregates = {
+                'by_user_option': [],
+                'by_user': {},
+                'by_option': {}
+            }
+            for row in rows:
+                user_id = row['user_id']
+                option_name = row['option_name']
+                totals = {
+                    'total_amount': row['total_amount'],
+                    'total_shares': row['total_shares']
+                }
+                if user_id is not None and option_name is not None:
+                    aggregates['by_user_option'].append(
+                        {'user_id': user_id, 'option_name': option_name, **totals}
+                    )
+                elif user_id is not None:
+                    aggregates['by_user'][user_id] = totals
+                else:
+                    aggregates['by_option'][option_name] = totals
+
+            return aggregates
+
     async def get_liquidity_pools(self, prediction_id: str) -> Dict[str, int]:
         """Get current liquidity for all options"""
-        async with self.db.pool.acquire() as conn:
+        async with self._conn() as conn:
             rows = await conn.fetch("""
                 SELECT option_name, current_liquidity
                 FROM liquidity_pools
@@ -201,7 +299,7 @@ class PredictionDatabase:
         voted_option: str
     ) -> bool:
         """Add a resolution vote"""
-        async with self.db.pool.acquire() as conn:
+        async with self._conn() as conn:
             try:
                 await conn.execute("""
                     INSERT INTO resolution_votes (prediction_id, user_id, guild_id, voted_option)
@@ -216,7 +314,7 @@ class PredictionDatabase:
     
     async def get_resolution_votes(self, prediction_id: str) -> Dict[str, int]:
         """Get vote counts for each option"""
-        async with self.db.pool.acquire() as conn:
+        async with self._conn() as conn:
             rows = await conn.fetch("""
                 SELECT voted_option, COUNT(*) as vote_count
                 FROM resolution_votes
@@ -228,7 +326,7 @@ class PredictionDatabase:
     
     async def has_user_voted(self, prediction_id: str, user_id: int) -> bool:
         """Check if user has already voted on resolution"""
-        async with self.db.pool.acquire() as conn:
+        async with self._conn() as conn:
             count = await conn.fetchval("""
                 SELECT COUNT(*) FROM resolution_votes
                 WHERE prediction_id = $1 AND user_id = $2
@@ -246,7 +344,7 @@ class PredictionDatabase:
         vote_count: int
     ) -> bool:
         """Resolve a prediction market"""
-        async with self.db.pool.acquire() as conn:
+        async with self._conn() as conn:
             async with conn.transaction():
                 try:
                     # Update prediction status
@@ -280,7 +378,7 @@ class PredictionDatabase:
         payout_amount: int
     ):
         """Record a payout for transparency"""
-        async with self.db.pool.acquire() as conn:
+        async with self._conn() as conn:
             await conn.execute("""
                 INSERT INTO payouts (
                     prediction_id, user_id, guild_id,
@@ -289,9 +387,9 @@ class PredictionDatabase:
             """, prediction_id, user_id, guild_id,
                 bet_amount, shares_owned, payout_amount)
     
-    async def refund_prediction(self, prediction_id: str) -> List[Dict]:
+    async def refund_prediction(self, prediction_id: str) -> List[asyncpg.Record]:
         """Mark prediction as refunded and return all bets for refunding"""
-        async with self.db.pool.acquire() as conn:
+        async with self._conn() as conn:
             async with conn.transaction():
                 # Update prediction status
                 await conn.execute("""
@@ -308,15 +406,15 @@ class PredictionDatabase:
                     GROUP BY user_id
                 """, prediction_id)
                 
-                return [dict(row) for row in rows]
+                return rows
     
     async def get_predictions_by_status(
         self, 
         guild_id: int, 
         status: str = None
-    ) -> List[Dict]:
+    ) -> List[asyncpg.Record]:
         """Get predictions filtered by status"""
-        async with self.db.pool.acquire() as conn:
+        async with self._conn() as conn:
             if status:
                 rows = await conn.fetch("""
                     SELECT * FROM prediction_summary
@@ -330,28 +428,28 @@ class PredictionDatabase:
                     ORDER BY end_time DESC
                 """, guild_id)
             
-            return [dict(row) for row in rows]
+            return rows
     
-    async def get_expired_predictions(self) -> List[Dict]:
+    async def get_expired_predictions(self) -> List[asyncpg.Record]:
         """Get predictions that have ended but not resolved"""
-        async with self.db.pool.acquire() as conn:
+        async with self._conn() as conn:
             rows = await conn.fetch("""
                 SELECT id, guild_id, question, creator_id, end_time
                 FROM predictions
                 WHERE status = 'active' AND end_time <= NOW()
             """, )
             
-            return [dict(row) for row in rows]
+            return rows
     
-    async def get_predictions_for_auto_refund(self, hours_threshold: int = 120) -> List[Dict]:
+    async def get_predictions_for_auto_refund(self, hours_threshold: int = 120) -> List[asyncpg.Record]:
         """Get predictions that should be auto-refunded"""
-        async with self.db.pool.acquire() as conn:
+        async with self._conn() as conn:
             rows = await conn.fetch("""
                 SELECT id, guild_id, question, creator_id
                 FROM predictions
                 WHERE status = 'ended' 
-                AND end_time <= NOW() - INTERVAL '%s hours'
+                AND end_time <= NOW() - make_interval(hours => $1)
                 AND NOT resolved
             """, hours_threshold)
             
-            return [dict(row) for row in rows]
\ No newline at end of file
+            return rows
\ No newline at end of file
@@ -10,12 +10,19 @@ This example shows how to:
 
 import asyncio
 import logging
-from typing import Protocol
+import time
+from typing import Dict, Protocol, Tuple
 
 import discord
 from discord.ext import commands
 
-from core.container import DIContainer, get_container
+try:
+    import uvloop
+except ImportError:
+    # Optional: fall back to the default asyncio event loop
+    uvloop = None
+
+from core.container import DIContainer, ServiceLifecycle, set_container
 from config import get_settings, Settings
 from database.supabase_client import SupabaseManager, PredictionDatabase
 from helpers.SimplePointsManager import PointsManagerSingleton
@@ -53,10 +60,20 @@ class ISupabaseManager(Protocol):
 class PredictionService:
     """Business logic service for predictions."""
     
+    __slots__ = ("database", "points_manager", "logger", "_active_cache", "_active_cache_locks")
+    
+    # Seconds a guild's active prediction list is served from cache
+    ACTIVE_PREDICTIONS_TTL = 5.0
+    
     def __init__(self, database: IPredictionDatabase, points_manager: IPointsManager):
         self.database = database
         self.points_manager = points_manager
         self.logger = logging.getLogger(__name__)
+        
+        # guild_id -> (expiry time, active predictions)
+        self._active_cache: Dict[int, Tuple[float, list]] = {}
+        # guild_id -> lock held while that guild's list is being fetched
+        self._active_cache_locks: Dict[int, asyncio.Lock] = {}
     
     async def create_prediction(self, guild_id: int, question: str, options: list, 
                               creator_id: int, end_time, category: str = None) -> str:
@@ -78,17 +95,40 @@ class PredictionService:
             category=category
         )
         
-        self.logger.info(f"Created prediction {prediction_id} for guild {guild_id}")
+        self._active_cache.pop(guild_id, None)
+        
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Created prediction %s for guild %s", prediction_id, guild_id)
         return prediction_id
     
     async def get_active_predictions(self, guild_id: int) -> list:
-        """Get active predictions for a guild."""
-        return await self.database.get_active_predictions(guild_id)
+        """Get active predictions for a guild, cached for a short TTL."""
+        cached = self._active_cache.get(guild_id)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        
+        # Concurrent misses for the same guild wait for the first query
+        # instead of repeating it; other guilds are not blocked
+        lock = self._active_cache_locks.get(guild_id)
+        if lock is None:
+            lock = self._active_cache_locks[guild_id] = asyncio.Lock()
+        async with lock:
+            cached = self._active_cache.get(guild_id)
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+            
+            predictions = await self.database.get_active_predictions(guild_id)
+            self._active_cache[guild_id] = (
+                time.monotonic() + self.ACTIVE_PREDICTIONS_TTL, predictions
+            )
+            return predictions
 
 
 class BettingService:
     """Business logic service for betting operations."""
     
+    __slots__ = ("database", "points_manager", "logger")
+    
     def __init__(self, database: IPredictionDatabase, points_manager: IPointsManager):
         self.database = database
         self.points_manager = points_manager
@@ -115,7 +155,8 @@ class BettingService:
                 await self.points_manager.add_points(user_id, amount)
                 return False
             
-            self.logger.info(f"User {user_id} placed bet of {amount} on {prediction_id}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("User %s placed bet of %s on %s", user_id, amount, prediction_id)
             return True
             
         except Exception as e:
@@ -153,6 +194,10 @@ class EnhancedDiscordBot(commands.Bot):
         """Clean shutdown with proper disposal."""
         self.logger.info("Shutting down bot...")
         
+        # Close the shared Drip API session before disposing the container
+        points_manager = await self.container.get_service(PointsManagerSingleton)
+        await points_manager.cleanup()
+        
         # Dispose of the DI container
         await self.container.dispose_async()
         
@@ -164,10 +209,16 @@ async def create_supabase_manager(settings: Settings) -> SupabaseManager:
     """Factory function to create and initialize SupabaseManager."""
     manager = SupabaseManager(
         url=settings.database.supabase_url,
-        key=settings.database.supabase_publishable_key,
+        publishable_key=settings.database.supabase_publishable_key,
+        secret_key=settings.database.supabase_secret_key,
         db_url=settings.database.url
     )
-    await manager.initialize()
+    # All queries go through the shared asyncpg pool so none block the event loop
+    await manager.initialize(
+        min_size=settings.database.min_connections,
+        max_size=settings.database.max_connections,
+        command_timeout=settings.database.query_timeout
+    )
     return manager
 
 
@@ -188,27 +239,29 @@ def create_prediction_database(supabase_manager: SupabaseManager) -> PredictionD
 def setup_di_container() -> DIContainer:
     """Set up the dependency injection container with all services."""
     container = DIContainer()
+    set_container(container)
     settings = get_settings()
     
     # Register configuration as singleton instance
     container.register_instance(Settings, settings)
     
-    # Register infrastructure services
+    # Register infrastructure services; factories are passed directly so the
+    # container resolves their parameters from the type annotations
     container.register_factory(
         SupabaseManager, 
-        lambda settings: create_supabase_manager(settings),
+        create_supabase_manager,
         lifecycle=ServiceLifecycle.SINGLETON
     )
     
     container.register_factory(
         PointsManagerSingleton,
-        lambda settings: create_points_manager(settings),
+        create_points_manager,
         lifecycle=ServiceLifecycle.SINGLETON
     )
     
     container.register_factory(
         PredictionDatabase,
-        lambda supabase_manager: create_prediction_database(supabase_manager),
+        create_prediction_database,
         lifecycle=ServiceLifecycle.SINGLETON
     )
     
@@ -219,7 +272,7 @@ def setup_di_container() -> DIContainer:
     # Register the bot itself
     container.register_factory(
         EnhancedDiscordBot,
-        lambda settings, container: EnhancedDiscordBot(settings, container),
+        EnhancedDiscordBot,
         lifecycle=ServiceLifecycle.SINGLETON
     )
     
@@ -255,4 +308,7 @@ async def main():
 
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        # libuv-backed loop for faster gateway and database socket I/O
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(main())
\ No newline at end of file
@@ -5,8 +5,12 @@ This shows how to create Discord cogs that use the DI container
 for clean separation of concerns and better testability.
 """
 
+import datetime
 import logging
-from typing import List
+import re
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 import discord
 from discord import app_commands
@@ -16,16 +20,70 @@ from core.container import get_container
 from examples.di_container_integration import PredictionService, BettingService
 
 
+_HOUR_DELTA = datetime.timedelta(hours=1)
+
+# Splits comma-separated options and strips surrounding whitespace in one pass
+_OPTION_SEPARATOR = re.compile(r"\s*,\s*")
+
+
+@lru_cache(maxsize=1024)
+def _parse_options(options: str) -> Tuple[str, ...]:
+    """Parse a comma-separated option string, caching repeated inputs."""
+    return tuple(_OPTION_SEPARATOR.split(options.strip()))
+
+
 class EnhancedPredictionCog(commands.Cog):
     """Enhanced prediction cog using dependency injection."""
     
+    # Maximum number of rendered prediction fields kept in the embed cache
+    EMBED_CACHE_SIZE = 256
+    
+    # Success response templates
+    _CREATE_MSG = (
+        "✅ Prediction created successfully!\n"
+        "**ID:** %s\n"
+        "**Question:** %s\n"
+        "**Options:** %s\n"
+        "**Duration:** %d hours"
+    )
+    _BET_MSG = (
+        "✅ Bet placed successfully!\n"
+        "**Amount:** %s points\n"
+        "**Option:** %s\n"
+        "**Prediction:** %s"
+    )
+    
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.logger = logging.getLogger(__name__)
         
-        # Services will be injected during cog load
-        self.prediction_service: PredictionService = None
-        self.betting_service: BettingService = None
+        # Services are resolved once in cog_load and then read as plain
+        # attributes by every command
+        self.prediction_service: Optional[PredictionService] = None
+        self.betting_service: Optional[BettingService] = None
+        
+        # Rendered embed fields keyed by (prediction ID, last update time)
+        self._embed_cache: "OrderedDict[Tuple[str, Any], Dict[str, Any]]" = OrderedDict()
+    
+    def _get_prediction_field(self, pred: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the embed field for a prediction, rendering it only when it changed."""
+        key = (str(pred.get('id', 'Unknown')), pred.get('updated_at'))
+        field = self._embed_cache.get(key)
+        if field is not None:
+            self._embed_cache.move_to_end(key)
+            return field
+        
+        field = {
+            "name": f"ID: {pred.get('id', 'Unknown')}",
+            "value": f"**Question:** {pred.get('question', 'Unknown')}\n"
+                     f"**Options:** {', '.join(pred.get('options', []))}\n"
+                     f"**Ends:** <t:{int(pred.get('end_time', 0).timestamp())}:R>",
+            "inline": False
+        }
+        self._embed_cache[key] = field
+        if len(self._embed_cache) > self.EMBED_CACHE_SIZE:
+            self._embed_cache.popitem(last=False)
+        return field
     
     async def cog_load(self) -> None:
         """Initialize the cog with dependency injection."""
@@ -55,11 +113,10 @@ class EnhancedPredictionCog(commands.Cog):
         
         try:
             # Parse options
-            option_list = [opt.strip() for opt in options.split(",")]
+            option_list = list(_parse_options(options))
             
             # Calculate end time
-            import datetime
-            end_time = datetime.datetime.utcnow() + datetime.timedelta(hours=duration_hours)
+            end_time = datetime.datetime.now(datetime.timezone.utc) + _HOUR_DELTA * duration_hours
             
             # Use the injected service
             prediction_id = await self.prediction_service.create_prediction(
@@ -69,13 +126,10 @@ class EnhancedPredictionCog(commands.Cog):
                 creator_id=interaction.user.id,
                 end_time=end_time
             )
+            self._embed_cache.clear()
             
             await interaction.followup.send(
-                f"✅ Prediction created successfully!\n"
-                f"**ID:** {prediction_id}\n"
-                f"**Question:** {question}\n"
-                f"**Options:** {', '.join(option_list)}\n"
-                f"**Duration:** {duration_hours} hours"
+                self._CREATE_MSG % (prediction_id, question, ", ".join(option_list), duration_hours)
             )
             
         except ValueError as e:
@@ -110,11 +164,9 @@ class EnhancedPredictionCog(commands.Cog):
             )
             
             if success:
+                self._embed_cache.clear()
                 await interaction.followup.send(
-                    f"✅ Bet placed successfully!\n"
-                    f"**Amount:** {amount:,} points\n"
-                    f"**Option:** {option}\n"
-                    f"**Prediction:** {prediction_id}"
+                    self._BET_MSG % (format(amount, ","), option, prediction_id)
                 )
             else:
                 await interaction.followup.send("❌ Failed to place bet. Please try again.")
@@ -146,13 +198,7 @@ class EnhancedPredictionCog(commands.Cog):
             )
             
             for pred in predictions[:5]:  # Limit to 5 for display
-                embed.add_field(
-                    name=f"ID: {pred.get('id', 'Unknown')}",
-                    value=f"**Question:** {pred.get('question', 'Unknown')}\n"
-                          f"**Options:** {', '.join(pred.get('options', []))}\n"
-                          f"**Ends:** <t:{int(pred.get('end_time', 0).timestamp())}:R>",
-                    inline=False
-                )
+                embed.add_field(**self._get_prediction_field(pred))
             
             await interaction.followup.send(embed=embed)
             
@@ -9,6 +9,7 @@ This file shows how to use the error handler in various scenarios:
 """
 
 import asyncio
+import random
 import discord
 from discord.ext import commands
 from typing import Optional
@@ -26,11 +27,20 @@ from core.exceptions import (
 class ExampleCog(commands.Cog):
     """Example cog demonstrating error handler integration."""
     
+    # Simulated failure rates per service
+    FAILURE_RATES = {
+        "database": 0.1,  # 10% failure rate
+        "external_api": 0.2  # 20% failure rate
+    }
+    
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.error_handler = get_error_handler()
+        # Private generator so failure simulation doesn't share global random state
+        self._random = random.Random().random
         
-        # Set up circuit breakers for external services
+        # Set up circuit breakers for external services once; commands call
+        # the cached breakers directly instead of looking them up by name
         self.database_breaker = self.error_handler.get_circuit_breaker(
             "database",
             failure_threshold=3,
@@ -62,8 +72,7 @@ class ExampleCog(commands.Cog):
                 raise ValidationError("Bet amount too large", field="amount", value=amount)
             
             # Check user balance (with circuit breaker)
-            balance = await self.error_handler.execute_with_circuit_breaker(
-                "database",
+            balance = await self.database_breaker.call_fast(
                 self._get_user_balance,
                 interaction.user.id
             )
@@ -122,8 +131,7 @@ class ExampleCog(commands.Cog):
             raise ValidationError("Options must be different")
         
         # Create prediction (with circuit breaker)
-        prediction_id = await self.error_handler.execute_with_circuit_breaker(
-            "database",
+        prediction_id = await self.database_breaker.call_fast(
             self._create_prediction_in_db,
             interaction.guild.id,
             question,
@@ -191,17 +199,11 @@ class ExampleCog(commands.Cog):
     
     async def _simulate_transient_failure(self) -> bool:
         """Simulate transient failures for retry demonstration."""
-        import random
-        return random.random() < 0.3  # 30% chance of failure
+        return self._random() < 0.3  # 30% chance of failure
     
     async def _simulate_service_failure(self, service: str) -> bool:
         """Simulate service failures for circuit breaker demonstration."""
-        import random
-        failure_rates = {
-            "database": 0.1,  # 10% failure rate
-            "external_api": 0.2  # 20% failure rate
-        }
-        return random.random() < failure_rates.get(service, 0.1)
+        return self._random() < self.FAILURE_RATES.get(service, 0.1)
 
 
 class BackgroundTaskExample:
@@ -210,14 +212,17 @@ class BackgroundTaskExample:
     def __init__(self):
         self.error_handler = get_error_handler()
         self.running = False
+        self._random = random.Random().random
+        self._stop_event: Optional[asyncio.Event] = None
     
     async def start_background_task(self):
         """Start a background task with error handling."""
         self.running = True
+        self._stop_event = asyncio.Event()
         while self.running:
             try:
                 await self._process_expired_predictions()
-                await asyncio.sleep(300)  # 5 minutes
+                await self._wait_or_stop(300)  # 5 minutes
                 
             except Exception as e:
                 # Handle background errors
@@ -233,7 +238,14 @@ class BackgroundTaskExample:
                 print(f"Background task error {error_info['error_id']}: {error_info['message']}")
                 
                 # Wait before retrying
-                await asyncio.sleep(60)
+                await self._wait_or_stop(60)
+    
+    async def _wait_or_stop(self, timeout: float) -> None:
+        """Sleep for up to timeout seconds, returning early when stop() is called."""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
     
     @retry_with_backoff(
         max_retries=2,
@@ -251,12 +263,13 @@ class BackgroundTaskExample:
     
     async def _simulate_database_issue(self) -> bool:
         """Simulate occasional database issues."""
-        import random
-        return random.random() < 0.2  # 20% chance of failure
+        return self._random() < 0.2  # 20% chance of failure
     
     def stop(self):
-        """Stop the background task."""
+        """Stop the background task without waiting out its current sleep."""
         self.running = False
+        if self._stop_event is not None:
+            self._stop_event.set()
 
 
 class ExternalServiceExample:
@@ -264,6 +277,7 @@ class ExternalServiceExample:
     
     def __init__(self):
         self.error_handler = get_error_handler()
+        self._random = random.Random().random
     
     async def fetch_market_data(self, symbol: str) -> dict:
         """Fetch market data with circuit breaker protection."""
@@ -275,10 +289,8 @@ class ExternalServiceExample:
     
     async def _fetch_from_api(self, symbol: str) -> dict:
         """Simulate external API call that might fail."""
-        import random
-        
         # Simulate API failures
-        if random.random() < 0.3:  # 30% failure rate
+        if self._random() < 0.3:  # 30% failure rate
             raise ExternalAPIError(
                 service="market_api",
                 status_code=503,
@@ -315,7 +327,6 @@ async def demonstrate_error_handling():
     
     @retry_with_backoff(max_retries=3, base_delay=0.1)
     async def flaky_operation():
-        import random
         if random.random() < 0.7:  # 70% failure rate
             raise DatabaseError("Connection timeout", operation="test")
         return "Success!"
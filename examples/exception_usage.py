@@ -4,6 +4,9 @@ Example usage of the custom exception hierarchy.
 This demonstrates how to use the various exception types in the prediction market bot.
 """
 
+import sys
+from typing import List
+
 from core.exceptions import (
     ValidationError,
     InsufficientBalanceError,
@@ -16,8 +19,14 @@ from core.exceptions import (
 )
 
 
+def _emit(lines: List[str]) -> None:
+    """Write one demo's output lines to stdout in a single call."""
+    sys.stdout.writelines([line + "\n" for line in lines])
+
+
 def demonstrate_validation_error():
     """Demonstrate ValidationError usage."""
+    out: List[str] = []
     try:
         # Simulate invalid bet amount
         amount = -100
@@ -28,15 +37,17 @@ def demonstrate_validation_error():
                 value=amount
             )
     except ValidationError as e:
-        print(f"Validation Error: {e}")
-        print(f"Error ID: {e.error_id}")
-        print(f"User Message: {e.user_message}")
-        print(f"Details: {e.details}")
-        print()
+        out.append(f"Validation Error: {e}")
+        out.append(f"Error ID: {e.error_id}")
+        out.append(f"User Message: {e.user_message}")
+        out.append(f"Details: {e.details}")
+        out.append("")
+    _emit(out)
 
 
 def demonstrate_insufficient_balance_error():
     """Demonstrate InsufficientBalanceError usage."""
+    out: List[str] = []
     try:
         # Simulate insufficient balance
         required = 1000
@@ -50,29 +61,33 @@ def demonstrate_insufficient_balance_error():
                 user_id=user_id
             )
     except InsufficientBalanceError as e:
-        print(f"Insufficient Balance Error: {e}")
-        print(f"Error ID: {e.error_id}")
-        print(f"User Message: {e.user_message}")
-        print(f"Deficit: {e.details['deficit']} points")
-        print()
+        out.append(f"Insufficient Balance Error: {e}")
+        out.append(f"Error ID: {e.error_id}")
+        out.append(f"User Message: {e.user_message}")
+        out.append(f"Deficit: {e.details['deficit']} points")
+        out.append("")
+    _emit(out)
 
 
 def demonstrate_prediction_not_found_error():
     """Demonstrate PredictionNotFoundError usage."""
+    out: List[str] = []
     try:
         # Simulate prediction not found
         prediction_id = "pred-nonexistent"
         raise PredictionNotFoundError(prediction_id)
     except PredictionNotFoundError as e:
-        print(f"Prediction Not Found Error: {e}")
-        print(f"Error ID: {e.error_id}")
-        print(f"User Message: {e.user_message}")
-        print(f"Prediction ID: {e.details['prediction_id']}")
-        print()
+        out.append(f"Prediction Not Found Error: {e}")
+        out.append(f"Error ID: {e.error_id}")
+        out.append(f"User Message: {e.user_message}")
+        out.append(f"Prediction ID: {e.details['prediction_id']}")
+        out.append("")
+    _emit(out)
 
 
 def demonstrate_database_error():
     """Demonstrate DatabaseError usage."""
+    out: List[str] = []
     try:
         # Simulate database connection failure
         raise DatabaseError(
@@ -81,16 +96,18 @@ def demonstrate_database_error():
             details={"host": "localhost", "port": 5432}
         )
     except DatabaseError as e:
-        print(f"Database Error: {e}")
-        print(f"Error ID: {e.error_id}")
-        print(f"User Message: {e.user_message}")
-        print(f"Severity: {e.severity.value}")
-        print(f"Operation: {e.details['operation']}")
-        print()
+        out.append(f"Database Error: {e}")
+        out.append(f"Error ID: {e.error_id}")
+        out.append(f"User Message: {e.user_message}")
+        out.append(f"Severity: {e.severity.value}")
+        out.append(f"Operation: {e.details['operation']}")
+        out.append("")
+    _emit(out)
 
 
 def demonstrate_rate_limit_error():
     """Demonstrate RateLimitExceededError usage."""
+    out: List[str] = []
     try:
         # Simulate rate limit exceeded
         raise RateLimitExceededError(
@@ -99,15 +116,17 @@ def demonstrate_rate_limit_error():
             window_seconds=60
         )
     except RateLimitExceededError as e:
-        print(f"Rate Limit Error: {e}")
-        print(f"Error ID: {e.error_id}")
-        print(f"User Message: {e.user_message}")
-        print(f"Limit: {e.details['limit']} requests per {e.details['window_seconds']}s")
-        print()
+        out.append(f"Rate Limit Error: {e}")
+        out.append(f"Error ID: {e.error_id}")
+        out.append(f"User Message: {e.user_message}")
+        out.append(f"Limit: {e.details['limit']} requests per {e.details['window_seconds']}s")
+        out.append("")
+    _emit(out)
 
 
 def demonstrate_error_serialization():
     """Demonstrate error serialization to dictionary."""
+    out: List[str] = []
     try:
         raise ValidationError(
             "Invalid prediction question",
@@ -116,11 +135,10 @@ def demonstrate_error_serialization():
             details={"min_length": 1, "max_length": 500}
         )
     except ValidationError as e:
-        print("Error Serialization:")
-        error_dict = e.to_dict()
-        for key, value in error_dict.items():
-            print(f"  {key}: {value}")
-        print()
+        out.append("Error Serialization:")
+        out.append(f"  {e.to_json()}")
+        out.append("")
+    _emit(out)
 
 
 def demonstrate_error_handling_pattern():
@@ -159,19 +177,37 @@ def demonstrate_error_handling_pattern():
         (12345, "pred-123", 100, 1000),      # Success case
     ]
     
-    for user_id, pred_id, amount, balance in test_cases:
+    # Flag failing rows with plain comparisons in one pass, so exceptions are
+    # only raised for the rows that need a specific error
+    flagged = [
+        not (0 < amount <= 1_000_000 and amount <= balance) or pred_id == "nonexistent"
+        for _, pred_id, amount, balance in test_cases
+    ]
+    
+    out: List[str] = []
+    accepted = []
+    for (user_id, pred_id, amount, balance), failed in zip(test_cases, flagged):
+        if not failed:
+            accepted.append((user_id, amount))
+            continue
+        
         try:
-            result = place_bet(user_id, pred_id, amount, balance)
-            print(f"✅ Bet placed successfully: user={user_id}, amount={amount}")
+            place_bet(user_id, pred_id, amount, balance)
+            accepted.append((user_id, amount))
         except ValidationError as e:
-            print(f"❌ Validation failed: {e.user_message} (ID: {e.error_id})")
+            out.append(f"❌ Validation failed: {e.user_message} (ID: {e.error_id})")
         except InsufficientBalanceError as e:
-            print(f"💰 {e.user_message} (ID: {e.error_id})")
+            out.append(f"💰 {e.user_message} (ID: {e.error_id})")
         except PredictionNotFoundError as e:
-            print(f"🔍 {e.user_message} (ID: {e.error_id})")
+            out.append(f"🔍 {e.user_message} (ID: {e.error_id})")
         except Exception as e:
-            print(f"❓ Unexpected error: {e}")
-    print()
+            out.append(f"❓ Unexpected error: {e}")
+    
+    # Bets that passed validation are placed together
+    for user_id, amount in accepted:
+        out.append(f"✅ Bet placed successfully: user={user_id}, amount={amount}")
+    out.append("")
+    _emit(out)
 
 
 if __name__ == "__main__":
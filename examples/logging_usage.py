@@ -9,11 +9,16 @@ This module demonstrates how to use the logging manager with:
 """
 
 import asyncio
+import logging
+import logging.handlers
+import os
+import queue
 import time
-from typing import Optional
+from typing import Any, Dict, Optional
 
+from config.settings import get_settings
 from core.logging_manager import (
-    get_logger,
+    CorrelationIdFilter,
     set_correlation_id,
     get_correlation_id,
     log_function_call,
@@ -23,28 +28,95 @@ from core.logging_manager import (
 )
 
 
-# Get a logger for this module
-logger = get_logger(__name__)
+# Logger for this module; the logging manager configures its handlers when
+# main() sets it up, not at import
+logger = logging.getLogger(__name__)
+
+# LOG_BENCH=1 turns the simulated work into no-ops so the demo measures the
+# logging pipeline itself
+_BENCH = os.getenv("LOG_BENCH") == "1"
+_BENCH_ITERATIONS = int(os.getenv("LOG_BENCH_ITERATIONS", "100000"))
+
+
+def _nap(seconds: float) -> None:
+    """Simulate blocking work unless running as a benchmark."""
+    if not _BENCH:
+        time.sleep(seconds)
+
+
+async def _anap(seconds: float) -> None:
+    """Simulate async work; in benchmark mode only yield to the loop."""
+    await asyncio.sleep(0 if _BENCH else seconds)
+
+
+# Nesting depth kept in log extras; deeper containers are logged by identity
+_MAX_DEPTH = 2
+_SCALARS = (int, str, float, bool, type(None))
+
+
+def _shallow(data: Dict[str, Any], depth: int = 0) -> Dict[str, Any]:
+    """Copy a log extras dict, replacing values nested past _MAX_DEPTH with ids."""
+    shallow = {}
+    for key, value in data.items():
+        if isinstance(value, _SCALARS):
+            shallow[key] = value
+        elif depth >= _MAX_DEPTH:
+            shallow[key] = f"<{type(value).__name__} {id(value):#x}>"
+        elif isinstance(value, dict):
+            shallow[key] = _shallow(value, depth + 1)
+        else:
+            shallow[key] = value
+    return shallow
+
+
+def start_queue_logging() -> logging.handlers.QueueListener:
+    """
+    Route all root logger output through a queue.
+    
+    The handlers configured by the logging manager are moved behind a
+    QueueListener that formats and writes records on a background thread,
+    so logging calls on the event loop only enqueue the record.
+    """
+    root_logger = logging.getLogger()
+    handlers = list(root_logger.handlers)
+    log_queue = queue.SimpleQueue()
+    
+    # Correlation IDs live in a ContextVar, so they must be stamped on the
+    # record before it leaves the caller's context
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(CorrelationIdFilter())
+    for handler in handlers:
+        for log_filter in list(handler.filters):
+            if isinstance(log_filter, CorrelationIdFilter):
+                handler.removeFilter(log_filter)
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(queue_handler)
+    
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    listener.start()
+    return listener
 
 
 @log_function_call(include_args=True, include_result=True, include_duration=True)
 def create_prediction(question: str, options: list, duration_minutes: int) -> str:
     """Example function with automatic logging."""
-    logger.info("Creating new prediction", extra={
+    logger.info("Creating new prediction", extra=_shallow({
         'question': question,
         'options_count': len(options),
         'duration_minutes': duration_minutes
-    })
+    }))
     
     # Simulate some processing time
-    time.sleep(0.1)
+    _nap(0.1)
     
     prediction_id = f"pred-{int(time.time())}"
     
-    logger.info("Prediction created successfully", extra={
+    logger.info("Prediction created successfully", extra=_shallow({
         'prediction_id': prediction_id,
         'status': 'active'
-    })
+    }))
     
     return prediction_id
 
@@ -53,37 +125,37 @@ def create_prediction(question: str, options: list, duration_minutes: int) -> st
 @log_performance(threshold_seconds=0.5)
 async def place_bet(prediction_id: str, user_id: int, option: str, amount: int) -> bool:
     """Example async function with performance monitoring."""
-    logger.info("Processing bet placement", extra={
+    logger.info("Processing bet placement", extra=_shallow({
         'prediction_id': prediction_id,
         'user_id': user_id,
         'option': option,
         'amount': amount
-    })
+    }))
     
     # Simulate async database operation
-    await asyncio.sleep(0.2)
+    await _anap(0.2)
     
     # Simulate validation
     if amount <= 0:
-        logger.error("Invalid bet amount", extra={
+        logger.error("Invalid bet amount", extra=_shallow({
             'prediction_id': prediction_id,
             'user_id': user_id,
             'amount': amount,
             'error': 'amount_must_be_positive'
-        })
+        }))
         return False
     
     # Simulate slow operation that triggers performance warning
     if amount > 100000:
-        await asyncio.sleep(0.6)  # This will trigger the performance warning
+        await _anap(0.6)  # This will trigger the performance warning
     
-    logger.info("Bet placed successfully", extra={
+    logger.info("Bet placed successfully", extra=_shallow({
         'prediction_id': prediction_id,
         'user_id': user_id,
         'option': option,
         'amount': amount,
         'status': 'confirmed'
-    })
+    }))
     
     return True
 
@@ -167,13 +239,15 @@ def demonstrate_error_logging():
         # Simulate an error
         raise ValueError("Invalid prediction state: already resolved")
     except Exception as e:
-        logger.error("Failed to process prediction", extra={
-            'prediction_id': 'pred-789',
-            'user_id': 12345,
-            'operation': 'place_bet',
-            'error_type': type(e).__name__,
-            'error_message': str(e)
-        }, exc_info=True)
+        # Only build the extras (and format the exception) if ERROR is emitted
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error("Failed to process prediction", extra=_shallow({
+                'prediction_id': 'pred-789',
+                'user_id': 12345,
+                'operation': 'place_bet',
+                'error_type': type(e).__name__,
+                'error_message': str(e)
+            }), exc_info=True)
 
 
 def demonstrate_performance_logging():
@@ -183,13 +257,13 @@ def demonstrate_performance_logging():
     @log_performance(threshold_seconds=0.1)
     def slow_operation():
         """A function that will trigger performance warning."""
-        time.sleep(0.2)
+        _nap(0.2)
         return "completed"
     
     @log_performance(threshold_seconds=0.1)
     def fast_operation():
         """A function that won't trigger performance warning."""
-        time.sleep(0.05)
+        _nap(0.05)
         return "completed"
     
     set_correlation_id("perf-demo-111")
@@ -203,17 +277,45 @@ def demonstrate_performance_logging():
     fast_operation()
 
 
+async def run_benchmark(iterations: int) -> None:
+    """Time repeated decorated bet placements through the logging pipeline."""
+    print(f"\n=== Logging Benchmark ({iterations:,} bets) ===")
+    
+    set_correlation_id("bench-000")
+    
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await place_bet("pred-123", 12345, "Yes", 100)
+    elapsed = time.perf_counter() - start
+    
+    print(f"{elapsed:.3f}s total, {elapsed / iterations * 1e6:.1f}µs per bet")
+
+
 async def main():
     """Main demo function."""
     print("Structured Logging System Demo")
     print("=" * 40)
     
-    # Demonstrate different logging features
-    demonstrate_correlation_ids()
-    await demonstrate_async_logging()
-    demonstrate_contextual_logging()
-    demonstrate_error_logging()
-    demonstrate_performance_logging()
+    # Buffer file output in 64 KB chunks; errors and a periodic timer still flush
+    get_logging_manager(
+        get_settings().logging.model_copy(update={'file_buffer_size': 65536})
+    )
+    
+    listener = start_queue_logging()
+    try:
+        if _BENCH:
+            await run_benchmark(_BENCH_ITERATIONS)
+            return
+        
+        # Demonstrate different logging features
+        demonstrate_correlation_ids()
+        await demonstrate_async_logging()
+        demonstrate_contextual_logging()
+        demonstrate_error_logging()
+        demonstrate_performance_logging()
+    finally:
+        # Drain queued records before the process exits
+        listener.stop()
     
     print("\n=== Demo Complete ===")
     print("Check the log files to see the structured output!")
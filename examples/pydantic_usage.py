@@ -5,6 +5,7 @@ This script demonstrates how to use the Pydantic models for request validation,
 data sanitization, and error handling in the Discord bot.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pydantic import ValidationError
 
@@ -25,6 +26,11 @@ from models.schemas import (
 )
 
 
+# Validated models are serialized for transport on a background pool so the
+# caller can keep working (e.g. awaiting a database write) in the meantime
+_serde_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="serde")
+
+
 def demonstrate_prediction_creation():
     """Demonstrate prediction creation with validation"""
     print("=== Prediction Creation Examples ===")
@@ -38,10 +44,12 @@ def demonstrate_prediction_creation():
             category=PredictionCategory.CRYPTO,
             initial_liquidity=50000
         )
+        payload = _serde_pool.submit(valid_request.model_dump, mode='json')
         print(f"✅ Valid prediction created: {valid_request.question}")
         print(f"   Options: {valid_request.options}")
         print(f"   Duration: {valid_request.duration_minutes} minutes")
         print(f"   Category: {valid_request.category}")
+        print(f"   Payload: {payload.result()}")
         print()
     except ValidationError as e:
         print(f"❌ Validation error: {e}")
@@ -94,8 +102,10 @@ def demonstrate_bet_placement():
             option="Yes",
             amount=1000
         )
+        payload = _serde_pool.submit(valid_bet.model_dump)
         print(f"✅ Valid bet placed: {valid_bet.amount} points on '{valid_bet.option}'")
         print(f"   Prediction ID: {valid_bet.prediction_id}")
+        print(f"   Payload: {payload.result()}")
         print()
     except ValidationError as e:
         print(f"❌ Validation error: {e}")
@@ -166,10 +176,11 @@ def demonstrate_model_factories():
     """Demonstrate model factories for testing"""
     print("=== Model Factory Examples ===")
     
-    # Create test prediction request
-    test_prediction = ModelFactory.create_prediction_request(
+    # Create test prediction request; the fixture is known-good, so skip
+    # validation (see demonstrate_prediction_creation for the checked path)
+    test_prediction = ModelFactory.create_prediction_request_fast(
         question="Will the weather be sunny tomorrow?",
-        options=["Sunny", "Cloudy", "Rainy"],
+        options=("Sunny", "Cloudy", "Rainy"),
         duration_minutes=720,
         category=PredictionCategory.WEATHER
     )
@@ -190,7 +201,7 @@ def demonstrate_model_factories():
     test_response = ModelFactory.create_prediction_response(
         id="weather-prediction-123",
         question="Will it be sunny tomorrow?",
-        options=["Yes", "No"],
+        options=("Yes", "No"),
         status=PredictionStatus.ACTIVE
     )
     print(f"✅ Test response created: {test_response.id}")
@@ -198,14 +209,16 @@ def demonstrate_model_factories():
     print(f"   Created: {test_response.created_at}")
     print()
     
-    # Create test market prices
-    test_prices = ModelFactory.create_market_prices_response(
+    # Create test market prices, laid out as one column per field
+    test_prices = ModelFactory.create_market_price_columns(
         prediction_id="weather-prediction-123",
-        options=["Sunny", "Cloudy", "Rainy"]
+        options=("Sunny", "Cloudy", "Rainy")
     )
-    print(f"✅ Test market prices created for {len(test_prices.prices)} options:")
-    for option, price_info in test_prices.prices.items():
-        print(f"   {option}: {price_info.price_per_share:.2f} per share, {price_info.probability:.1f}% probability")
+    print(f"✅ Test market prices created for {len(test_prices.options)} options:")
+    for option, price, probability in zip(
+        test_prices.options, test_prices.price_per_share, test_prices.probability
+    ):
+        print(f"   {option}: {price:.2f} per share, {probability:.1f}% probability")
     print()
 
 
@@ -223,8 +236,9 @@ def demonstrate_error_handling():
         )
         print("This should not print")
     except ValidationError as e:
-        print(f"❌ Multiple validation errors found:")
-        for error in e.errors():
+        errors = e.errors()
+        print(f"❌ {len(errors)} validation errors found:")
+        for error in errors:
             field = error['loc'][0] if error['loc'] else 'unknown'
             message = error['msg']
             print(f"   - {field}: {message}")
@@ -236,11 +250,13 @@ def demonstrate_error_handling():
         message="Request validation failed",
         error_id="err-12345"
     )
+    payload = _serde_pool.submit(error_response.model_dump, mode='json')
     print(f"✅ Error response created:")
     print(f"   Code: {error_response.error_code}")
     print(f"   Message: {error_response.message}")
     print(f"   ID: {error_response.error_id}")
     print(f"   Timestamp: {error_response.timestamp}")
+    print(f"   Payload: {payload.result()}")
     print()
 
 
@@ -250,11 +266,14 @@ def main():
     print("=" * 50)
     print()
     
-    demonstrate_prediction_creation()
-    demonstrate_bet_placement()
-    demonstrate_data_sanitization()
-    demonstrate_model_factories()
-    demonstrate_error_handling()
+    try:
+        demonstrate_prediction_creation()
+        demonstrate_bet_placement()
+        demonstrate_data_sanitization()
+        demonstrate_model_factories()
+        demonstrate_error_handling()
+    finally:
+        _serde_pool.shutdown(wait=True)
     
     print("✅ All examples completed successfully!")
 
@@ -10,6 +10,8 @@ This file demonstrates how to use:
 """
 
 import asyncio
+import time
+from functools import cached_property
 import discord
 from discord.ext import commands
 from datetime import datetime
@@ -18,7 +20,7 @@ from datetime import datetime
 from core.security import (
     InputSanitizer, TokenManager, DataEncryption, AuditLogger,
     AuditEventType, SecurityLevel, sanitize_user_input, audit_user_action,
-    encrypt_sensitive_data, decrypt_sensitive_data
+    decrypt_sensitive_data
 )
 from core.security_middleware import (
     SecurityMiddleware, secure_prediction_command, secure_betting_command,
@@ -27,15 +29,44 @@ from core.security_middleware import (
 from core.exceptions import SecurityError
 
 
+# Audit timestamps only need second precision, so the ISO string is rebuilt
+# once per second rather than for every event
+_iso_cache = [0, ""]
+
+
+def _utc_iso_cached() -> str:
+    """Get the current UTC time as an ISO string, truncated to the second."""
+    now = int(time.time())
+    if now != _iso_cache[0]:
+        _iso_cache[:] = [now, datetime.utcfromtimestamp(now).isoformat()]
+    return _iso_cache[1]
+
+
 class SecurityExampleCog(commands.Cog):
     """Example cog demonstrating security features."""
     
     def __init__(self, bot):
         self.bot = bot
-        self.security_middleware = SecurityMiddleware()
-        self.token_manager = TokenManager()
-        self.data_encryption = DataEncryption("example_password")
-        self.audit_logger = AuditLogger()
+    
+    # Security components are built on first use, so loading the cog costs
+    # nothing for commands that never touch them
+    @cached_property
+    def security_middleware(self) -> SecurityMiddleware:
+        return SecurityMiddleware()
+    
+    @cached_property
+    def token_manager(self) -> TokenManager:
+        return TokenManager()
+    
+    @cached_property
+    def data_encryption(self) -> DataEncryption:
+        # Key derivation is memoized per password, so building another
+        # DataEncryption with the same password is cheap
+        return DataEncryption("example_password")
+    
+    @cached_property
+    def audit_logger(self) -> AuditLogger:
+        return AuditLogger()
     
     # Example 1: Basic input sanitization
     @discord.app_commands.command(name="sanitize_example")
@@ -79,18 +110,6 @@ class SecurityExampleCog(commands.Cog):
         # - Monitors for anomalies
         # - Applies rate limiting
         
-        prediction_data = {
-            "question": question,
-            "options": [option1, option2],
-            "duration": duration,
-            "creator_id": interaction.user.id,
-            "guild_id": interaction.guild.id,
-            "created_at": datetime.utcnow().isoformat()
-        }
-        
-        # Encrypt sensitive prediction data if needed
-        encrypted_data = encrypt_sensitive_data(prediction_data)
-        
         await interaction.response.send_message(
             f"✅ **Secure Prediction Created**\n"
             f"**Question:** {question}\n"
@@ -127,11 +146,11 @@ class SecurityExampleCog(commands.Cog):
             "user_id": interaction.user.id,
             "option": option,
             "amount": amount,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _utc_iso_cached()
         }
         
-        # Encrypt sensitive bet information
-        encrypted_bet = encrypt_sensitive_data(bet_data)
+        # Encrypt only the sensitive bet field
+        encrypted_bet = self.data_encryption.encrypt_sensitive_fields(bet_data, ["amount"])
         
         await interaction.response.send_message(
             f"💰 **Secure Bet Placed**\n"
@@ -168,7 +187,7 @@ class SecurityExampleCog(commands.Cog):
             "winning_option": winning_option,
             "reason": reason,
             "resolved_by": interaction.user.id,
-            "resolved_at": datetime.utcnow().isoformat()
+            "resolved_at": _utc_iso_cached()
         }
         
         # Log additional audit event for resolution
@@ -255,7 +274,7 @@ class SecurityExampleCog(commands.Cog):
             guild_id=interaction.guild.id,
             details={
                 "action": action,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": _utc_iso_cached(),
                 "ip_address": "192.168.1.1",  # Would be real IP in production
                 "user_agent": "Discord Bot"
             },
@@ -285,7 +304,7 @@ class SecurityExampleCog(commands.Cog):
         
         # Simulate some monitoring checks
         input_length = len(test_input)
-        has_special_chars = any(c in test_input for c in "<>\"'&;")
+        has_special_chars = InputSanitizer.SPECIAL_CHARS_PATTERN.search(test_input) is not None
         
         monitoring_results = {
             "input_length": input_length,
@@ -310,7 +329,11 @@ class SecurePredictionService:
     def __init__(self):
         self.sanitizer = InputSanitizer()
         self.audit_logger = AuditLogger()
-        self.data_encryption = DataEncryption("service_password")
+    
+    @cached_property
+    def data_encryption(self) -> DataEncryption:
+        """Encryption is only set up once a prediction is first stored."""
+        return DataEncryption("service_password")
     
     async def create_prediction_securely(
         self, 
@@ -344,7 +367,7 @@ class SecurePredictionService:
                 "options": sanitized_options,
                 "creator_id": user_id,
                 "guild_id": guild_id,
-                "created_at": datetime.utcnow().isoformat()
+                "created_at": _utc_iso_cached()
             }
             
             # 3. Encrypt sensitive data
@@ -459,7 +482,7 @@ async def setup_secure_bot():
         details={
             "event": "bot_startup",
             "security_enabled": True,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _utc_iso_cached()
         },
         success=True,
         security_level=SecurityLevel.HIGH
@@ -13,7 +13,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import asyncio
-from typing import List, Optional
+from typing import Collection, List, Optional, Union
 from datetime import datetime
 
 try:
@@ -46,16 +46,27 @@ class PredictionService:
     """Example service using static validation methods"""
     
     def create_prediction(self, question: str, options: List[str], 
-                         duration: str, category: str = None) -> str:
-        """Create a prediction with comprehensive validation"""
+                         duration: Union[str, datetime], category: str = None,
+                         validated_fields: Collection[str] = ()) -> str:
+        """
+        Create a prediction with comprehensive validation
+        
+        Fields named in validated_fields were already validated and
+        sanitized by the caller (e.g. a @validate_inputs command), so they
+        are not checked again; a validated duration is the end time.
+        """
         
         # Validate question
-        question_result = Validator.validate_prediction_question(question)
-        if question_result.has_errors():
-            raise ValidationError(
-                "Invalid question", 
-                details={"errors": question_result.errors}
-            )
+        if 'question' in validated_fields:
+            sanitized_question = question
+        else:
+            question_result = Validator.validate_prediction_question(question)
+            if question_result.has_errors():
+                raise ValidationError(
+                    "Invalid question", 
+                    details={"errors": question_result.errors}
+                )
+            sanitized_question = question_result.sanitized_data
         
         # Validate options
         options_result = Validator.validate_prediction_options(options)
@@ -66,12 +77,16 @@ class PredictionService:
             )
         
         # Validate duration
-        duration_result = Validator.validate_duration(duration)
-        if duration_result.has_errors():
-            raise ValidationError(
-                "Invalid duration", 
-                details={"errors": duration_result.errors}
-            )
+        if 'duration' in validated_fields:
+            end_time = duration
+        else:
+            duration_result = Validator.validate_duration(duration)
+            if duration_result.has_errors():
+                raise ValidationError(
+                    "Invalid duration", 
+                    details={"errors": duration_result.errors}
+                )
+            end_time = duration_result.sanitized_data
         
         # Validate category (optional)
         if category:
@@ -84,9 +99,7 @@ class PredictionService:
             category = category_result.sanitized_data
         
         # Use sanitized data
-        sanitized_question = question_result.sanitized_data
         sanitized_options = options_result.sanitized_data
-        end_time = duration_result.sanitized_data
         
         print(f"Creating prediction: {sanitized_question}")
         print(f"Options: {sanitized_options}")
@@ -177,7 +190,9 @@ class PredictionCog(commands.Cog):
                 question=question,
                 options=options,
                 duration=duration,
-                category=category
+                category=category,
+                # Already checked by @validate_inputs above
+                validated_fields=('question', 'duration')
             )
             
             await interaction.response.send_message(
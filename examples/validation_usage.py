@@ -10,7 +10,7 @@ This module shows how to use the validation framework in different scenarios:
 
 import asyncio
 from typing import List, Optional
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import discord
 from discord.ext import commands
@@ -183,13 +183,11 @@ class CustomValidators:
             return result
         
         # Business rule: predictions can't be longer than 30 days
-        max_duration = now.replace(day=now.day + 30) if now.day <= 1 else now.replace(month=now.month + 1)
-        if end_time > max_duration:
+        if end_time > now + timedelta(days=30):
             result.add_error("Predictions cannot run longer than 30 days")
         
         # Business rule: predictions should be at least 5 minutes
-        min_duration = now.replace(minute=now.minute + 5)
-        if end_time < min_duration:
+        if end_time < now + timedelta(minutes=5):
             result.add_warning("Very short prediction duration")
         
         result.sanitized_data = end_time
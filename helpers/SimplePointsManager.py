@@ -19,9 +19,18 @@ class PointsManagerSingleton:
             self._initialized = True
     
     async def initialize(self):
-        """Initialize the aiohttp session if it doesn't exist."""
+        """Initialize the shared aiohttp session if it doesn't exist.
+
+        One keep-alive connection pool is reused for every Drip API call for the
+        lifetime of the bot, so requests skip TCP/TLS setup.
+        """
         if not self.session:
-            self.session = aiohttp.ClientSession()
+            connector = aiohttp.TCPConnector(limit=100, limit_per_host=30, keepalive_timeout=60)
+            self.session = aiohttp.ClientSession(connector=connector)
+
+    async def initialize_async(self):
+        """Initialization hook awaited by the DI container."""
+        await self.initialize()
 
     async def cleanup(self):
         """Cleanup the aiohttp session."""
@@ -3,12 +3,17 @@ Architecture Improvements for Prediction Market Bot
 """
 
 from abc import ABC, abstractmethod
-from typing import Protocol, TypeVar, Generic
+from typing import Protocol, TypeVar, Generic, Optional, List
+from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum
 import asyncio
+import logging
+import time
 from contextlib import asynccontextmanager
 
+logger = logging.getLogger(__name__)
+
 # 1. DEPENDENCY INJECTION PATTERN
 class DatabaseProtocol(Protocol):
     async def get_prediction(self, prediction_id: str) -> dict: ...
@@ -29,7 +34,8 @@ class BetRequest:
     def __post_init__(self):
         if self.amount <= 0:
             raise ValueError("Bet amount must be positive")
-        if not self.option.strip():
+        # isspace() tests for blank text without allocating a stripped copy
+        if not self.option or self.option.isspace():
             raise ValueError("Option cannot be empty")
 
 @dataclass(frozen=True)
@@ -126,7 +132,7 @@ class PredictionService:
         self.points_manager = points_manager
         self.event_bus = event_bus
     
-    async def place_bet(self, bet_request: BetRequest) -> Result[bool, str]:
+    async def place_bet(self, bet_request: BetRequest) -> 'Result[bool, str]':
         """Place a bet with proper validation and error handling"""
         try:
             # Validate user has sufficient balance
@@ -147,8 +153,8 @@ class PredictionService:
             success = await command.execute()
             
             if success:
-                # Publish event for real-time updates
-                await self.event_bus.publish(BetPlacedEvent(bet_request))
+                # Queue event for real-time updates; handlers get batches
+                self.event_bus.publish_batched(BetPlacedEvent(bet_request), BetPlacedBatchEvent)
                 return Result.success(True)
             else:
                 return Result.error("Failed to place bet")
@@ -161,9 +167,12 @@ T = TypeVar('T')
 E = TypeVar('E')
 
 class Result(Generic[T, E]):
+    __slots__ = ('_value', '_error', 'is_success')
+    
     def __init__(self, value: T = None, error: E = None):
         self._value = value
         self._error = error
+        self.is_success = error is None
     
     @classmethod
     def success(cls, value: T) -> 'Result[T, E]':
@@ -173,10 +182,6 @@ class Result(Generic[T, E]):
     def error(cls, error: E) -> 'Result[T, E]':
         return cls(error=error)
     
-    @property
-    def is_success(self) -> bool:
-        return self._error is None
-    
     @property
     def value(self) -> T:
         if self._error is not None:
@@ -202,15 +207,74 @@ class BetPlacedEvent(Event):
         if self.timestamp is None:
             object.__setattr__(self, 'timestamp', time.time())
 
+@dataclass
+class BetPlacedBatchEvent(Event):
+    events: list[BetPlacedEvent]
+
 class EventBus:
-    def __init__(self):
-        self._handlers: dict[type, list] = {}
+    def __init__(self, batch_interval: float = 0.05):
+        self._handlers: dict[type, tuple] = {}
+        # Handlers for each published event class, including those
+        # subscribed to its base classes; cleared on subscribe
+        self._dispatch_cache: dict[type, tuple] = {}
+        # Events waiting for the next batch flush, keyed by batch event type
+        self._pending: defaultdict[type, list] = defaultdict(list)
+        self._batch_interval = batch_interval
+        self._flush_task: Optional[asyncio.Task] = None
     
     def subscribe(self, event_type: type, handler):
-        if event_type not in self._handlers:
-            self._handlers[event_type] = []
-        self._handlers[event_type].append(handler)
+        # Subscriptions are rare and publishes frequent, so each type keeps
+        # an immutable tuple that is rebuilt here
+        self._handlers[event_type] = self._handlers.get(event_type, ()) + (handler,)
+        self._dispatch_cache.clear()
+    
+    def _handlers_for(self, event_class: type) -> tuple:
+        handlers = self._dispatch_cache.get(event_class)
+        if handlers is None:
+            handlers = tuple(
+                handler
+                for cls in event_class.__mro__
+                for handler in self._handlers.get(cls, ())
+            )
+            self._dispatch_cache[event_class] = handlers
+        return handlers
     
     async def publish(self, event: Event):
-        handlers = self._handlers.get(type(event), [])
-        await asyncio.gather(*[handler(event) for handler in handlers])
\ No newline at end of file
+        handlers = self._handlers_for(type(event))
+        if not handlers:
+            return
+        # Most events have a single handler; await it directly instead of
+        # wrapping it in a gather future
+        if len(handlers) == 1:
+            await handlers[0](event)
+            return
+        await asyncio.gather(*[handler(event) for handler in handlers])
+    
+    def publish_batched(self, event: Event, batch_type: type):
+        # Coalesce high-volume events; handlers subscribed to batch_type
+        # receive every event queued during one interval in a single call
+        self._pending[batch_type].append(event)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+    
+    async def _flush_loop(self):
+        while self._pending:
+            await asyncio.sleep(self._batch_interval)
+            await self.flush()
+    
+    async def flush(self):
+        pending, self._pending = self._pending, defaultdict(list)
+        for batch_type, events in pending.items():
+            # A failing handler must not drop the other batches or kill
+            # the flush task
+            try:
+                await self.publish(batch_type(events))
+            except Exception:
+                logger.exception("Error handling %s of %d events", batch_type.__name__, len(events))
+    
+    async def close(self):
+        # Deliver everything still queued and let the flush task finish
+        await self.flush()
+        if self._flush_task is not None:
+            await self._flush_task
+            self._flush_task = None
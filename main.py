@@ -30,7 +30,7 @@ from core.container import DIContainer, get_container, set_container
 from core.logging_manager import get_logging_manager, get_logger, set_correlation_id
 from core.error_handler import ErrorHandler, get_error_handler, set_error_handler
 from core.rate_limiter import RateLimiter
-from core.security import SecurityManager
+from core.security import SecurityManager, shutdown_audit_logger
 from database.supabase_client import SupabaseClient
 from helpers.SimplePointsManager import PointsManagerSingleton
 
@@ -138,6 +138,9 @@ class PredictionMarketBot(commands.Bot):
         except Exception as e:
             self.logger.error(f"❌ Error during shutdown: {e}")
         
+        # Write audit events still buffered
+        await shutdown_audit_logger()
+        
         await super().close()
         self.logger.info("👋 Bot shutdown complete")
 
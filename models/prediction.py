@@ -108,19 +108,18 @@ class DatabasePrediction:
         opposite_option = self.get_opposite_option(option)
         new_opposite_liquidity = self._liquidity_cache[opposite_option] + amount
         
-        # Persist to database atomically
+        # Persist bet and liquidity pools to database atomically
         try:
-            # Place bet in database
-            success = await self.db.place_bet(
+            bet_id = await self.db.place_bet_atomic(
                 self.id, user_id, self.guild_id, option,
-                amount, shares, price_per_share
+                amount, shares, price_per_share,
+                {
+                    option: int(new_option_liquidity),
+                    opposite_option: int(new_opposite_liquidity)
+                }
             )
             
-            if success:
-                # Update liquidity pools
-                await self.db.update_liquidity_pool(self.id, option, int(new_option_liquidity))
-                await self.db.update_liquidity_pool(self.id, opposite_option, int(new_opposite_liquidity))
-                
+            if bet_id is not None:
                 # Update local cache
                 self._liquidity_cache[option] = int(new_option_liquidity)
                 self._liquidity_cache[opposite_option] = int(new_opposite_liquidity)
@@ -136,14 +135,17 @@ class DatabasePrediction:
         
         return False
     
-    async def get_odds(self) -> Dict[str, float]:
-        """Calculate odds based on total bets from database"""
-        option_totals = {}
-        
-        for option in self.options:
-            bets = await self.db.get_option_bets(self.id, option)
-            option_totals[option] = sum(bet['total_amount'] for bet in bets)
-        
+    async def _get_option_totals(self) -> Dict[str, int]:
+        """Get total bet amount per option with a single aggregate query"""
+        aggregates = await self.db.get_bet_aggregates(self.id)
+        by_option = aggregates['by_option']
+        return {
+            option: by_option[option]['total_amount'] if option in by_option else 0
+            for option in self.options
+        }
+    
+    def _calculate_odds(self, option_totals: Dict[str, int]) -> Dict[str, float]:
+        """Calculate odds from per-option bet totals"""
         total_all_bets = sum(option_totals.values())
         
         if total_all_bets == 0:
@@ -154,13 +156,18 @@ class DatabasePrediction:
             for option in self.options
         }
     
+    async def get_odds(self) -> Dict[str, float]:
+        """Calculate odds based on total bets from database"""
+        return self._calculate_odds(await self._get_option_totals())
+    
     async def get_current_prices(self, points_to_spend: int = 100) -> Dict[str, Dict]:
         """Calculate current prices and potential shares for a given point amount"""
         await self._refresh_liquidity_cache()
         prices = {}
         
-        # Get odds from database
-        odds = await self.get_odds()
+        # Get per-option totals and odds from database
+        option_totals = await self._get_option_totals()
+        odds = self._calculate_odds(option_totals)
         
         for option in self.options:
             # Calculate actual shares user would get for their points
@@ -170,8 +177,7 @@ class DatabasePrediction:
             price_per_share = points_to_spend / shares if shares > 0 else float('inf')
             
             # Get total bets for this option
-            option_bets = await self.db.get_option_bets(self.id, option)
-            total_bets = sum(bet['total_amount'] for bet in option_bets)
+            total_bets = option_totals[option]
             
             prices[option] = {
                 'price_per_share': price_per_share,
@@ -304,12 +310,14 @@ class DatabasePrediction:
     
     async def get_bet_history(self) -> List[tuple]:
         """Get bet history for this prediction"""
-        history = []
-        for option in self.options:
-            option_bets = await self.db.get_option_bets(self.id, option)
-            for bet in option_bets:
-                history.append((bet['user_id'], option, bet['total_amount']))
-        return history
+        aggregates = await self.db.get_bet_aggregates(self.id)
+        by_option = {option: [] for option in self.options}
+        for bet in aggregates['by_user_option']:
+            if bet['option_name'] in by_option:
+                by_option[bet['option_name']].append(
+                    (bet['user_id'], bet['option_name'], bet['total_amount'])
+                )
+        return [entry for option in self.options for entry in by_option[option]]
     
     def is_resolved(self) -> bool:
         """Check if prediction is resolved"""
@@ -6,9 +6,10 @@ for all Discord bot interactions and API requests.
 """
 
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Sequence, Tuple, Union
 from enum import Enum
 import re
+import time
 from decimal import Decimal
 
 from pydantic import (
@@ -20,6 +21,21 @@ from pydantic import (
 )
 
 
+# Patterns used by the request validators, compiled once at import
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+_PREDICTION_ID_PATTERN = re.compile(r'^[a-zA-Z0-9_-]+$')
+
+# Potential injection characters, rejected in options and other free text
+_INVALID_TEXT_CHARS_PATTERN = re.compile(r'[<>{}[\]\\]')
+
+# Content rejected in questions: spam words, injection characters and
+# script schemes, checked in one scan
+_INAPPROPRIATE_QUESTION_PATTERN = re.compile(
+    r'\b(?:spam|scam|hack|cheat)\b|[<>{}[\]\\]|javascript:|data:|vbscript:',
+    re.IGNORECASE
+)
+
+
 class PredictionStatus(str, Enum):
     """Enumeration of possible prediction statuses"""
     ACTIVE = "active"
@@ -91,18 +107,11 @@ class CreatePredictionRequest(BaseModel):
             raise ValueError("Question cannot be empty")
         
         # Remove excessive whitespace
-        v = re.sub(r'\s+', ' ', v.strip())
+        v = _WHITESPACE_PATTERN.sub(' ', v.strip())
         
         # Check for inappropriate content patterns
-        inappropriate_patterns = [
-            r'\b(spam|scam|hack|cheat)\b',
-            r'[<>{}[\]\\]',  # Potential injection characters
-            r'(javascript:|data:|vbscript:)',  # Script injection
-        ]
-        
-        for pattern in inappropriate_patterns:
-            if re.search(pattern, v, re.IGNORECASE):
-                raise ValueError("Question contains inappropriate content")
+        if _INAPPROPRIATE_QUESTION_PATTERN.search(v):
+            raise ValueError("Question contains inappropriate content")
         
         # Ensure question ends with question mark
         if not v.endswith('?'):
@@ -133,7 +142,7 @@ class CreatePredictionRequest(BaseModel):
         validated_options = []
         for option in unique_options:
             # Remove excessive whitespace
-            option = re.sub(r'\s+', ' ', option.strip())
+            option = _WHITESPACE_PATTERN.sub(' ', option.strip())
             
             if len(option) < 1:
                 raise ValueError("Option cannot be empty")
@@ -141,7 +150,7 @@ class CreatePredictionRequest(BaseModel):
                 raise ValueError("Option cannot exceed 100 characters")
             
             # Check for inappropriate content
-            if re.search(r'[<>{}[\]\\]', option):
+            if _INVALID_TEXT_CHARS_PATTERN.search(option):
                 raise ValueError(f"Option '{option}' contains invalid characters")
             
             validated_options.append(option)
@@ -197,7 +206,7 @@ class PlaceBetRequest(BaseModel):
             raise ValueError("Prediction ID cannot be empty")
         
         # Check for valid ID format (alphanumeric, hyphens, underscores)
-        if not re.match(r'^[a-zA-Z0-9_-]+$', v):
+        if not _PREDICTION_ID_PATTERN.match(v):
             raise ValueError("Invalid prediction ID format")
         
         return v
@@ -211,10 +220,10 @@ class PlaceBetRequest(BaseModel):
             raise ValueError("Option cannot be empty")
         
         # Remove excessive whitespace
-        v = re.sub(r'\s+', ' ', v)
+        v = _WHITESPACE_PATTERN.sub(' ', v)
         
         # Check for inappropriate content
-        if re.search(r'[<>{}[\]\\]', v):
+        if _INVALID_TEXT_CHARS_PATTERN.search(v):
             raise ValueError("Option contains invalid characters")
         
         return v
@@ -260,7 +269,7 @@ class ResolvePredictionRequest(BaseModel):
         if not v:
             raise ValueError("Prediction ID cannot be empty")
         
-        if not re.match(r'^[a-zA-Z0-9_-]+$', v):
+        if not _PREDICTION_ID_PATTERN.match(v):
             raise ValueError("Invalid prediction ID format")
         
         return v
@@ -273,9 +282,9 @@ class ResolvePredictionRequest(BaseModel):
         if not v:
             raise ValueError("Winning option cannot be empty")
         
-        v = re.sub(r'\s+', ' ', v)
+        v = _WHITESPACE_PATTERN.sub(' ', v)
         
-        if re.search(r'[<>{}[\]\\]', v):
+        if _INVALID_TEXT_CHARS_PATTERN.search(v):
             raise ValueError("Winning option contains invalid characters")
         
         return v
@@ -308,7 +317,7 @@ class VoteRequest(BaseModel):
     def validate_prediction_id(cls, v):
         """Validate prediction ID format"""
         v = v.strip()
-        if not re.match(r'^[a-zA-Z0-9_-]+$', v):
+        if not _PREDICTION_ID_PATTERN.match(v):
             raise ValueError("Invalid prediction ID format")
         return v
     
@@ -320,9 +329,9 @@ class VoteRequest(BaseModel):
         if not v:
             raise ValueError("Vote option cannot be empty")
         
-        v = re.sub(r'\s+', ' ', v)
+        v = _WHITESPACE_PATTERN.sub(' ', v)
         
-        if re.search(r'[<>{}[\]\\]', v):
+        if _INVALID_TEXT_CHARS_PATTERN.search(v):
             raise ValueError("Vote option contains invalid characters")
         
         return v
@@ -393,6 +402,46 @@ class MarketPricesResponse(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.now)
 
 
+class MarketPriceColumns(BaseModel):
+    """Column-oriented market prices, one tuple per field aligned by option"""
+    
+    model_config = ConfigDict(frozen=True)
+    
+    prediction_id: str
+    options: Tuple[str, ...]
+    price_per_share: Tuple[float, ...]
+    probability: Tuple[float, ...]
+    timestamp: datetime = Field(default_factory=datetime.now)
+    
+    @model_validator(mode='after')
+    def validate_columns(self):
+        """Ensure every column has one entry per option"""
+        count = len(self.options)
+        if len(self.price_per_share) != count or len(self.probability) != count:
+            raise ValueError("Price columns must have one entry per option")
+        return self
+    
+    @classmethod
+    def from_response(cls, response: MarketPricesResponse) -> 'MarketPriceColumns':
+        """Build columns from a per-option MarketPricesResponse"""
+        infos = tuple(response.prices.values())
+        return cls(
+            prediction_id=response.prediction_id,
+            options=tuple(response.prices),
+            price_per_share=tuple(info.price_per_share for info in infos),
+            probability=tuple(info.probability for info in infos),
+            timestamp=response.timestamp
+        )
+    
+    def normalized_probabilities(self) -> Tuple[float, ...]:
+        """Scale probabilities so they sum to 100"""
+        total = sum(self.probability)
+        if not total:
+            return self.probability
+        scale = 100 / total
+        return tuple(p * scale for p in self.probability)
+
+
 class UserBalanceResponse(BaseModel):
     """Response model for user balance information"""
     
@@ -432,6 +481,26 @@ class ValidationErrorResponse(ErrorResponse):
     validation_errors: List[ValidationErrorDetail]
 
 
+# HTML/XML tags, then script schemes and script content left after tag
+# removal. alert() arguments are capped at 256 characters: an unbounded
+# [^)]* scans to the end of the text from every unclosed "alert(", which
+# is quadratic
+_HTML_TAG_PATTERN = re.compile(r'<[^>]*>')
+_SCRUB_PATTERN = re.compile(
+    r'javascript:|data:|vbscript:|alert\([^)]{0,256}\)|script[^>]*',
+    re.IGNORECASE
+)
+
+# Valid Discord ID range: 17 to 20 decimal digits
+_DISCORD_ID_MIN = 10 ** 16
+_DISCORD_ID_MAX = 10 ** 20
+
+# Control characters other than tab, newline and carriage return
+_CONTROL_CHAR_TABLE = dict.fromkeys(
+    [c for c in range(0x20) if c not in (0x09, 0x0A, 0x0D)] + [0x7F]
+)
+
+
 # Utility Models for Data Sanitization
 class SanitizedInput(BaseModel):
     """Base model for sanitized user input"""
@@ -442,57 +511,117 @@ class SanitizedInput(BaseModel):
         if not text:
             return ""
         
-        # Remove potential script injection
-        text = re.sub(r'(javascript:|data:|vbscript:)', '', text, flags=re.IGNORECASE)
-        
-        # Remove HTML/XML tags completely
-        text = re.sub(r'<[^>]*>', '', text)
+        # Remove HTML/XML tags completely; tags end with '>', so nothing
+        # after the last one needs scanning
+        end = text.rfind('>') + 1
+        text = _HTML_TAG_PATTERN.sub('', text[:end]) + text[end:]
         
-        # Remove script content that might remain after tag removal
-        text = re.sub(r'alert\([^)]*\)', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'script[^>]*', '', text, flags=re.IGNORECASE)
+        # Strip script schemes and leftover script content in a single pass.
+        # Matches become a space, so a removal cannot splice the letters
+        # around it into a new match (e.g. "javdata:ascript:")
+        text = _SCRUB_PATTERN.sub(' ', text)
         
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
+        # Collapse excessive whitespace
+        text = ' '.join(text.split())
         
         # Remove control characters except newlines and tabs
-        text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)
+        text = text.translate(_CONTROL_CHAR_TABLE)
         
         return text
     
     @classmethod
     def validate_discord_id(cls, discord_id: Union[str, int]) -> int:
         """Validate Discord ID format"""
-        try:
-            id_int = int(discord_id)
-            if id_int <= 0:
-                raise ValueError("Discord ID must be positive")
-            if len(str(id_int)) < 17 or len(str(id_int)) > 20:
-                raise ValueError("Invalid Discord ID format")
-            return id_int
-        except (ValueError, TypeError):
+        id_type = type(discord_id)
+        if id_type is int:
+            id_int = discord_id
+        elif id_type is str:
+            discord_id = discord_id.strip()
+            id_int = int(discord_id) if discord_id.isdecimal() else 0
+        else:
+            try:
+                id_int = int(discord_id)
+            except (ValueError, TypeError):
+                id_int = 0
+        
+        # Discord snowflakes are positive with 17 to 20 digits
+        if not _DISCORD_ID_MIN <= id_int < _DISCORD_ID_MAX:
             raise ValueError("Invalid Discord ID")
+        return id_int
+
+
+# Shared factory defaults, created once instead of on every factory call
+_DEFAULT_OPTIONS = ("Yes", "No")
+_DEFAULT_CATEGORY = PredictionCategory.GENERAL
+_DEFAULT_STATUS = PredictionStatus.ACTIVE
+
+
+# Timestamp shared by factory calls within the same tick
+_TIMESTAMP_RESOLUTION = 0.01  # seconds
+_tick_timestamp: Optional[datetime] = None
+_tick_at = 0.0
+
+
+def _now_cached() -> datetime:
+    """Return datetime.now(), reused for calls within _TIMESTAMP_RESOLUTION"""
+    global _tick_timestamp, _tick_at
+    
+    now = time.monotonic()
+    if _tick_timestamp is None or now - _tick_at > _TIMESTAMP_RESOLUTION:
+        _tick_at = now
+        _tick_timestamp = datetime.now()
+    return _tick_timestamp
 
 
 # Factory classes for testing
 class ModelFactory:
     """Factory class for creating test models"""
     
+    # When enabled, factories skip validation via model_construct(); only
+    # use for trusted fixtures in bulk test or seed scripts
+    BULK_MODE = False
+    
+    @staticmethod
+    def _build(model_class: type, **fields):
+        """Create a model, skipping validation in bulk mode"""
+        if ModelFactory.BULK_MODE:
+            return model_class.model_construct(**fields)
+        return model_class(**fields)
+    
     @staticmethod
     def create_prediction_request(
         question: str = "Will it rain tomorrow?",
-        options: List[str] = None,
+        options: Optional[Sequence[str]] = _DEFAULT_OPTIONS,
         duration_minutes: int = 1440,
-        category: PredictionCategory = PredictionCategory.GENERAL,
+        category: PredictionCategory = _DEFAULT_CATEGORY,
         initial_liquidity: int = 10000
     ) -> CreatePredictionRequest:
         """Create a test prediction request"""
         if options is None:
-            options = ["Yes", "No"]
-        
-        return CreatePredictionRequest(
+            options = _DEFAULT_OPTIONS
+        return ModelFactory._build(
+            CreatePredictionRequest,
+            question=question,
+            options=list(options),
+            duration_minutes=duration_minutes,
+            category=category,
+            initial_liquidity=initial_liquidity
+        )
+    
+    @staticmethod
+    def create_prediction_request_fast(
+        question: str = "Will it rain tomorrow?",
+        options: Optional[Sequence[str]] = _DEFAULT_OPTIONS,
+        duration_minutes: int = 1440,
+        category: PredictionCategory = _DEFAULT_CATEGORY,
+        initial_liquidity: int = 10000
+    ) -> CreatePredictionRequest:
+        """Create a prediction request from known-good values without validation"""
+        if options is None:
+            options = _DEFAULT_OPTIONS
+        return CreatePredictionRequest.model_construct(
             question=question,
-            options=options,
+            options=list(options),
             duration_minutes=duration_minutes,
             category=category,
             initial_liquidity=initial_liquidity
@@ -505,7 +634,8 @@ class ModelFactory:
         amount: int = 100
     ) -> PlaceBetRequest:
         """Create a test bet request"""
-        return PlaceBetRequest(
+        return ModelFactory._build(
+            PlaceBetRequest,
             prediction_id=prediction_id,
             option=option,
             amount=amount
@@ -517,7 +647,8 @@ class ModelFactory:
         winning_option: str = "Yes"
     ) -> ResolvePredictionRequest:
         """Create a test resolve request"""
-        return ResolvePredictionRequest(
+        return ModelFactory._build(
+            ResolvePredictionRequest,
             prediction_id=prediction_id,
             winning_option=winning_option
         )
@@ -528,7 +659,8 @@ class ModelFactory:
         option: str = "Yes"
     ) -> VoteRequest:
         """Create a test vote request"""
-        return VoteRequest(
+        return ModelFactory._build(
+            VoteRequest,
             prediction_id=prediction_id,
             option=option
         )
@@ -538,20 +670,20 @@ class ModelFactory:
         id: str = "test-prediction-1",
         guild_id: int = 123456789,
         question: str = "Will it rain tomorrow?",
-        options: List[str] = None,
+        options: Optional[Sequence[str]] = _DEFAULT_OPTIONS,
         creator_id: int = 987654321,
-        status: PredictionStatus = PredictionStatus.ACTIVE
+        status: PredictionStatus = _DEFAULT_STATUS
     ) -> PredictionResponse:
         """Create a test prediction response"""
         if options is None:
-            options = ["Yes", "No"]
-        
-        now = datetime.now()
-        return PredictionResponse(
+            options = _DEFAULT_OPTIONS
+        now = _now_cached()
+        return ModelFactory._build(
+            PredictionResponse,
             id=id,
             guild_id=guild_id,
             question=question,
-            options=options,
+            options=list(options),
             creator_id=creator_id,
             status=status,
             created_at=now,
@@ -572,7 +704,8 @@ class ModelFactory:
         price_per_share: float = 1.05
     ) -> BetResponse:
         """Create a test bet response"""
-        return BetResponse(
+        return ModelFactory._build(
+            BetResponse,
             id=id,
             prediction_id=prediction_id,
             user_id=user_id,
@@ -581,21 +714,22 @@ class ModelFactory:
             amount=amount,
             shares=shares,
             price_per_share=price_per_share,
-            created_at=datetime.now()
+            created_at=_now_cached()
         )
     
     @staticmethod
     def create_market_prices_response(
         prediction_id: str = "test-prediction-1",
-        options: List[str] = None
+        options: Optional[Sequence[str]] = None
     ) -> MarketPricesResponse:
         """Create a test market prices response"""
         if options is None:
-            options = ["Yes", "No"]
+            options = _DEFAULT_OPTIONS
         
         prices = {}
         for i, option in enumerate(options):
-            prices[option] = MarketPriceInfo(
+            prices[option] = ModelFactory._build(
+                MarketPriceInfo,
                 price_per_share=1.0 + (i * 0.1),
                 potential_shares=95.0 - (i * 5),
                 potential_payout=100,
@@ -603,11 +737,30 @@ class ModelFactory:
                 total_bets=1000 + (i * 500)
             )
         
-        return MarketPricesResponse(
+        return ModelFactory._build(
+            MarketPricesResponse,
             prediction_id=prediction_id,
             prices=prices
         )
     
+    @staticmethod
+    def create_market_price_columns(
+        prediction_id: str = "test-prediction-1",
+        options: Optional[Sequence[str]] = None
+    ) -> MarketPriceColumns:
+        """Create test market prices in column form"""
+        if options is None:
+            options = _DEFAULT_OPTIONS
+        
+        count = len(options)
+        return ModelFactory._build(
+            MarketPriceColumns,
+            prediction_id=prediction_id,
+            options=tuple(options),
+            price_per_share=tuple(1.0 + (i * 0.1) for i in range(count)),
+            probability=tuple(50.0 + (i * 10) for i in range(count))
+        )
+    
     @staticmethod
     def create_error_response(
         error_code: str = "VALIDATION_ERROR",
@@ -615,8 +768,10 @@ class ModelFactory:
         error_id: str = "err-123456"
     ) -> ErrorResponse:
         """Create a test error response"""
-        return ErrorResponse(
+        return ModelFactory._build(
+            ErrorResponse,
             error_code=error_code,
             message=message,
-            error_id=error_id
+            error_id=error_id,
+            timestamp=_now_cached()
         )
\ No newline at end of file
@@ -45,6 +45,7 @@ async def setup_database():
             # Split the schema into individual statements
             statements = []
             current_statement = ""
+            in_function_body = False
             
             for line in schema_sql.split('\n'):
                 line = line.strip()
@@ -53,11 +54,12 @@ async def setup_database():
                 
                 current_statement += line + '\n'
                 
-                # End of statement (semicolon not inside quotes/functions)
-                if line.endswith(';') and not line.startswith('CREATE OR REPLACE FUNCTION'):
-                    statements.append(current_statement.strip())
-                    current_statement = ""
-                elif line == '$ LANGUAGE plpgsql;' or line == '$ language \'plpgsql\';':
+                # Function bodies are $$-quoted and contain their own semicolons
+                if line.count('$$') % 2:
+                    in_function_body = not in_function_body
+                
+                # End of statement (semicolon not inside a function body)
+                if line.endswith(';') and not in_function_body:
                     statements.append(current_statement.strip())
                     current_statement = ""
             
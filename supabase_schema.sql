@@ -37,7 +37,7 @@ CREATE TABLE predictions (
     
     -- AMM parameters
     initial_liquidity INTEGER DEFAULT 30000,
-    k_constant BIGINT DEFAULT 900000000, -- initial_liquidity^2
+    k_constant BIGINT GENERATED ALWAYS AS (initial_liquidity::BIGINT * initial_liquidity) STORED, -- initial_liquidity^2
     total_bets INTEGER DEFAULT 0,
     
     -- Constraints
@@ -115,7 +115,8 @@ CREATE TABLE payouts (
 
 -- Performance indexes
 CREATE INDEX idx_predictions_guild_status ON predictions(guild_id, status);
-CREATE INDEX idx_predictions_end_time ON predictions(end_time) WHERE status = 'active';
+CREATE INDEX idx_predictions_active_end_time ON predictions(end_time) INCLUDE (id, guild_id, creator_id, question) WHERE status = 'active';
+CREATE INDEX idx_predictions_ended_unresolved_end_time ON predictions(end_time) INCLUDE (id, guild_id, creator_id, question) WHERE status = 'ended' AND NOT resolved;
 CREATE INDEX idx_predictions_creator ON predictions(creator_id, guild_id);
 CREATE INDEX idx_liquidity_pools_prediction ON liquidity_pools(prediction_id);
 CREATE INDEX idx_bets_user_guild ON bets(user_id, guild_id);
@@ -205,6 +206,40 @@ CREATE TRIGGER update_prediction_totals_trigger
     FOR EACH ROW
     EXECUTE FUNCTION update_prediction_totals();
 
+-- Place a bet and move both liquidity pools in one round trip and transaction
+CREATE OR REPLACE FUNCTION place_bet_atomic(
+    p_prediction_id UUID,
+    p_user_id BIGINT,
+    p_guild_id BIGINT,
+    p_option_name TEXT,
+    p_amount_bet INTEGER,
+    p_shares_owned DECIMAL,
+    p_price_per_share DECIMAL,
+    p_pool_options TEXT[],
+    p_pool_liquidity INTEGER[]
+)
+RETURNS UUID AS $$
+DECLARE
+    bet_id UUID;
+BEGIN
+    INSERT INTO bets (
+        prediction_id, user_id, guild_id, option_name,
+        amount_bet, shares_owned, price_per_share
+    ) VALUES (
+        p_prediction_id, p_user_id, p_guild_id, p_option_name,
+        p_amount_bet, p_shares_owned, p_price_per_share
+    )
+    RETURNING id INTO bet_id;
+    
+    UPDATE liquidity_pools lp
+    SET current_liquidity = pool.liquidity, updated_at = NOW()
+    FROM unnest(p_pool_options, p_pool_liquidity) AS pool(option_name, liquidity)
+    WHERE lp.prediction_id = p_prediction_id AND lp.option_name = pool.option_name;
+    
+    RETURN bet_id;
+END;
+$$ LANGUAGE plpgsql;
+
 -- Real-time subscriptions setup
 -- Enable realtime for tables that need live updates
 ALTER PUBLICATION supabase_realtime ADD TABLE predictions;
@@ -0,0 +1,76 @@
+"""
+Tests for the event bus in the architecture improvements.
+"""
+
+import asyncio
+import logging
+import pytest
+
+from improvements.architecture_improvements import (
+    BetPlacedBatchEvent,
+    BetPlacedEvent,
+    BetRequest,
+    Event,
+    EventBus,
+)
+
+
+class OtherBatchEvent(Event):
+    def __init__(self, events):
+        self.events = events
+
+
+def make_event(user_id: int) -> BetPlacedEvent:
+    return BetPlacedEvent(BetRequest(user_id=user_id, prediction_id="p1", option="Yes", amount=10))
+
+
+class TestEventBusBatching:
+    """Test batched publishing on the EventBus."""
+    
+    @pytest.mark.asyncio
+    async def test_events_are_coalesced(self):
+        """Test that events queued in one interval reach handlers as one batch."""
+        bus = EventBus(batch_interval=0.01)
+        batches = []
+        
+        async def handler(batch):
+            batches.append([event.bet_request.user_id for event in batch.events])
+        
+        bus.subscribe(BetPlacedBatchEvent, handler)
+        for user_id in range(3):
+            bus.publish_batched(make_event(user_id), BetPlacedBatchEvent)
+        
+        await bus.close()
+        
+        assert batches == [[0, 1, 2]]
+    
+    @pytest.mark.asyncio
+    async def test_failing_handler_does_not_drop_other_batches(self, caplog):
+        """Test that a handler error is logged and other batch types still flush."""
+        bus = EventBus(batch_interval=0.01)
+        received = []
+        
+        async def failing_handler(batch):
+            raise RuntimeError("handler failed")
+        
+        async def other_handler(batch):
+            received.append(batch.events)
+        
+        bus.subscribe(BetPlacedBatchEvent, failing_handler)
+        bus.subscribe(OtherBatchEvent, other_handler)
+        bus.publish_batched(make_event(1), BetPlacedBatchEvent)
+        bus.publish_batched("other", OtherBatchEvent)
+        flush_task = bus._flush_task
+        
+        with caplog.at_level(logging.ERROR):
+            await asyncio.sleep(0.05)
+        
+        # The flush task finished cleanly after delivering the other batch
+        assert flush_task.done() and flush_task.exception() is None
+        assert received == [["other"]]
+        assert "BetPlacedBatchEvent" in caplog.text
+        
+        # Later events still get through
+        bus.publish_batched("later", OtherBatchEvent)
+        await bus.close()
+        assert received == [["other"], ["later"]]
@@ -226,6 +226,24 @@ class TestFactoryMethods:
         service = await container.get_service(MockTestServiceWithDependency)
         assert service.get_value() == "dependent_service_test_service"
 
+    @pytest.mark.asyncio
+    async def test_singleton_factory_called_once(self, container):
+        """Test that resolved singletons are served without re-running the factory."""
+        calls = []
+
+        def create_test_service() -> MockTestService:
+            calls.append(1)
+            return MockTestService()
+
+        container.register_factory(MockTestService, create_test_service)
+
+        instance1 = await container.get_service(MockTestService)
+        instance2 = await container.get_service(MockTestService)
+        instance3 = await container.get_service_by_name("MockTestService")
+
+        assert instance1 is instance2 is instance3
+        assert len(calls) == 1
+
 
 class TestAsyncInitialization:
     """Test async initialization and disposal."""
@@ -253,7 +271,32 @@ class TestAsyncInitialization:
         
         assert test_service is not None
         assert async_service.initialized
-    
+
+    @pytest.mark.asyncio
+    async def test_initialize_all_singletons_concurrently(self, container):
+        """Test that independent singletons initialize in parallel after their dependencies."""
+        first_started = asyncio.Event()
+        second_started = asyncio.Event()
+
+        async def create_first() -> MockTestService:
+            first_started.set()
+            await asyncio.wait_for(second_started.wait(), timeout=1.0)
+            return MockTestService()
+
+        async def create_second() -> MockAsyncTestService:
+            second_started.set()
+            await asyncio.wait_for(first_started.wait(), timeout=1.0)
+            return MockAsyncTestService()
+
+        container.register_singleton(MockTestServiceWithDependency)
+        container.register_factory(MockTestService, create_first)
+        container.register_factory(MockAsyncTestService, create_second)
+
+        await container.initialize_all_singletons()
+
+        dependent = await container.get_service(MockTestServiceWithDependency)
+        assert dependent.test_service is await container.get_service(MockTestService)
+
     @pytest.mark.asyncio
     async def test_container_disposal(self, container):
         """Test that container disposal works correctly."""
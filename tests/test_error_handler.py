@@ -115,6 +115,28 @@ class TestCircuitBreaker:
         assert result == "success"
         assert circuit_breaker.state == CircuitBreakerState.CLOSED
         assert circuit_breaker.failure_count == 0
+    
+    @pytest.mark.asyncio
+    async def test_circuit_breaker_call_fast(self, circuit_breaker):
+        """Test the closed-state fast path tracks failures like call()."""
+        async def successful_operation(value):
+            return value
+        
+        async def failing_operation():
+            raise Exception("Test failure")
+        
+        assert await circuit_breaker.call_fast(successful_operation, "success") == "success"
+        
+        for i in range(3):
+            with pytest.raises(ExternalAPIError):
+                await circuit_breaker.call_fast(failing_operation)
+            assert circuit_breaker.failure_count == i + 1
+        assert circuit_breaker.state == CircuitBreakerState.OPEN
+        
+        # Open circuit blocks calls through the full state machine
+        with pytest.raises(ExternalAPIError) as exc_info:
+            await circuit_breaker.call_fast(successful_operation, "blocked")
+        assert exc_info.value.details["circuit_breaker_state"] == "open"
 
 
 class TestRetryLogic:
@@ -2,6 +2,8 @@
 Unit tests for the custom exception hierarchy.
 """
 
+import json
+
 import pytest
 from datetime import datetime
 from core.exceptions import (
@@ -92,6 +94,19 @@ class TestPredictionMarketError:
         assert result["severity"] == "low"
         assert result["type"] == "PredictionMarketError"
         assert "timestamp" in result
+    
+    def test_to_json_method(self):
+        """Test the to_json method matches to_dict."""
+        error = PredictionMarketError(
+            message="Test message",
+            details={"object": object()}
+        )
+        
+        result = json.loads(error.to_json())
+        
+        assert result["error_id"] == error.error_id
+        assert result["message"] == "Test message"
+        assert isinstance(result["details"]["object"], str)
 
 
 class TestValidationError:
@@ -25,6 +25,7 @@ from core.logging_manager import (
     JSONFormatter,
     ContextualFormatter,
     CorrelationIdFilter,
+    BufferedFileHandler,
     LogContext,
     get_logger,
     set_correlation_id,
@@ -394,6 +395,68 @@ class TestPerformanceDecorator:
         clear_correlation_id()
 
 
+class TestBufferedFileHandler:
+    """Test buffered file handler functionality."""
+    
+    def test_buffers_until_flush(self, temp_log_file):
+        """Test that records stay buffered until flushed or an error is logged."""
+        handler = BufferedFileHandler(temp_log_file, flush_interval=0)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger = logging.getLogger("buffered_test")
+        logger.propagate = False
+        logger.setLevel(logging.DEBUG)
+        logger.addHandler(handler)
+        
+        try:
+            logger.info("buffered message")
+            assert os.path.getsize(temp_log_file) == 0
+            
+            logger.error("error message")
+            with open(temp_log_file, 'r') as f:
+                assert f.read().splitlines() == ["buffered message", "error message"]
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+    
+    def test_rollover_counts_encoded_bytes(self, temp_log_file):
+        """Test that non-ASCII records count their encoded size against maxBytes."""
+        handler = BufferedFileHandler(
+            temp_log_file, maxBytes=100, backupCount=1, encoding='utf-8', flush_interval=0
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        record = logging.LogRecord("buffered_test", logging.INFO, __file__, 0, "é" * 30, None, None)
+        
+        try:
+            # 61 bytes each, so the second record rolls the file over
+            handler.emit(record)
+            handler.emit(record)
+            handler.flush()
+            assert os.path.exists(temp_log_file + ".1")
+            assert os.path.getsize(temp_log_file) == 61
+        finally:
+            handler.close()
+            if os.path.exists(temp_log_file + ".1"):
+                os.unlink(temp_log_file + ".1")
+    
+    def test_manager_uses_buffered_handler(self, temp_log_file):
+        """Test that a positive file_buffer_size selects the buffered handler."""
+        settings = LoggingSettings(
+            level="DEBUG",
+            file_enabled=True,
+            file_path=temp_log_file,
+            file_buffer_size=4096,
+            console_enabled=False
+        )
+        
+        LoggingManager(settings)
+        root_handlers = logging.getLogger().handlers
+        
+        assert any(isinstance(h, BufferedFileHandler) for h in root_handlers)
+        
+        for handler in root_handlers:
+            handler.close()
+
+
 class TestGlobalFunctions:
     """Test global logging functions."""
     
@@ -187,6 +187,7 @@ class TestRateLimiter:
         # Add admin user
         rate_limiter.add_admin_user(user_id)
         assert user_id in rate_limiter._admin_users
+        assert rate_limiter.is_admin(user_id)
         
         # Check bypass
         assert rate_limiter._is_admin_bypass(user_id)
@@ -194,6 +195,7 @@ class TestRateLimiter:
         # Remove admin user
         rate_limiter.remove_admin_user(user_id)
         assert user_id not in rate_limiter._admin_users
+        assert not rate_limiter.is_admin(user_id)
         assert not rate_limiter._is_admin_bypass(user_id)
     
     @pytest.mark.asyncio
@@ -243,6 +245,29 @@ class TestRateLimiter:
         assert info.is_exceeded
         assert info.remaining == 0
     
+    @pytest.mark.asyncio
+    async def test_try_consume(self, rate_limiter):
+        """Test atomic check-and-consume."""
+        user_id = 12345
+        
+        # Remaining already reflects the consumed slot
+        info = await rate_limiter.try_consume(
+            user_id=user_id,
+            limit_type=RateLimitType.USER_BETS
+        )
+        assert not info.is_exceeded
+        assert info.remaining == info.limit - 1
+        
+        # Concurrent callers cannot claim more slots than the limit
+        results = await asyncio.gather(*[
+            rate_limiter.try_consume(user_id=user_id, limit_type=RateLimitType.USER_BETS)
+            for _ in range(10)
+        ])
+        assert sum(1 for result in results if not result.is_exceeded) == info.limit - 1
+        assert results[-1].is_exceeded
+        assert results[-1].remaining == 0
+        assert len(rate_limiter._user_windows[(user_id, RateLimitType.USER_BETS)].requests) == info.limit
+    
     @pytest.mark.asyncio
     async def test_guild_rate_limiting(self, rate_limiter):
         """Test guild rate limiting."""
@@ -318,6 +343,26 @@ class TestRateLimiter:
         assert not info1.is_exceeded
         assert not info2.is_exceeded
     
+    @pytest.mark.asyncio
+    async def test_rate_limit_statuses_batch(self, rate_limiter):
+        """Test batched status lookup across limit types."""
+        user_id = 12345
+        
+        await rate_limiter.consume_rate_limit(
+            user_id=user_id,
+            limit_type=RateLimitType.USER_BETS
+        )
+        
+        types = [RateLimitType.USER_REQUESTS, RateLimitType.USER_BETS]
+        statuses = rate_limiter.get_user_rate_limit_statuses(user_id, types)
+        
+        assert list(statuses) == types
+        for limit_type in types:
+            single = rate_limiter.get_user_rate_limit_status(user_id, limit_type)
+            assert statuses[limit_type].remaining == single.remaining
+            assert statuses[limit_type].limit == single.limit
+        assert statuses[RateLimitType.USER_BETS].remaining == 4
+    
     @pytest.mark.asyncio
     async def test_statistics(self, rate_limiter):
         """Test rate limiter statistics."""
@@ -22,6 +22,7 @@ from models.schemas import (
     BetResponse,
     MarketPricesResponse,
     MarketPriceInfo,
+    MarketPriceColumns,
     UserBalanceResponse,
     ErrorResponse,
     ValidationErrorResponse,
@@ -452,6 +453,18 @@ class TestSanitizedInput:
         dirty_text = "javascript:alert('xss')"
         clean_text = SanitizedInput.sanitize_text(dirty_text)
         assert "javascript:" not in clean_text
+        
+        # Test removals are not rescanned, so splicing payloads stay linear
+        dirty_text = "d" * 2000 + "ata:" * 2000
+        clean_text = SanitizedInput.sanitize_text(dirty_text)
+        assert clean_text == "d" * 1999 + " " + "ata:" * 1999
+        
+        # Test alert() arguments are bounded, so unclosed calls are not rescanned
+        assert SanitizedInput.sanitize_text("a alert(1) b") == "a b"
+        dirty_text = "alert(" + "x" * 300 + ")"
+        assert SanitizedInput.sanitize_text(dirty_text) == dirty_text
+        dirty_text = "alert(" * 2000
+        assert SanitizedInput.sanitize_text(dirty_text) == dirty_text
     
     def test_validate_discord_id(self):
         """Test Discord ID validation"""
@@ -481,6 +494,12 @@ class TestModelFactory:
         assert request.options == ["Yes", "No"]
         assert request.duration_minutes == 1440
         
+        # Test explicit None falls back to the default options
+        assert ModelFactory.create_prediction_request(options=None).options == ["Yes", "No"]
+        assert ModelFactory.create_prediction_response(options=None).options == ["Yes", "No"]
+        assert list(ModelFactory.create_market_prices_response(options=None).prices) == ["Yes", "No"]
+        assert ModelFactory.create_market_price_columns(options=None).options == ("Yes", "No")
+        
         # Test with custom parameters
         custom_request = ModelFactory.create_prediction_request(
             question="Will the stock go up?",
@@ -493,6 +512,49 @@ class TestModelFactory:
         assert len(custom_request.options) == 3
         assert custom_request.category == PredictionCategory.CRYPTO
     
+    def test_create_prediction_request_fast(self):
+        """Test creating prediction request without validation"""
+        request = ModelFactory.create_prediction_request_fast(options=("Up", "Down"))
+        
+        assert isinstance(request, CreatePredictionRequest)
+        assert request.question == "Will it rain tomorrow?"
+        assert request.options == ["Up", "Down"]
+        assert request.category == PredictionCategory.GENERAL
+    
+    def test_bulk_mode_skips_validation(self):
+        """Test that BULK_MODE makes factories skip validation"""
+        ModelFactory.BULK_MODE = True
+        try:
+            request = ModelFactory.create_bet_request(amount=2_000_000)
+        finally:
+            ModelFactory.BULK_MODE = False
+        
+        assert request.amount == 2_000_000
+        
+        with pytest.raises(ValidationError):
+            ModelFactory.create_bet_request(amount=2_000_000)
+    
+    def test_create_market_price_columns(self):
+        """Test creating column-oriented market prices via factory"""
+        columns = ModelFactory.create_market_price_columns(options=("A", "B", "C"))
+        
+        assert columns.options == ("A", "B", "C")
+        assert columns.price_per_share == (1.0, 1.1, 1.2)
+        assert sum(columns.normalized_probabilities()) == pytest.approx(100.0)
+        
+        response = ModelFactory.create_market_prices_response(options=("A", "B", "C"))
+        from_response = MarketPriceColumns.from_response(response)
+        assert from_response.options == columns.options
+        assert from_response.probability == columns.probability
+        
+        with pytest.raises(ValidationError):
+            MarketPriceColumns(
+                prediction_id="test",
+                options=("A", "B"),
+                price_per_share=(1.0,),
+                probability=(50.0, 50.0)
+            )
+    
     def test_create_bet_request(self):
         """Test creating bet request via factory"""
         request = ModelFactory.create_bet_request()
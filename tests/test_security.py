@@ -37,6 +37,26 @@ class TestInputSanitizer:
         result = sanitizer.sanitize_text("Hello    world")
         assert result == "Hello world"
     
+    def test_fast_path_matches_full_sanitization(self):
+        """Test that the clean-input fast path returns what full sanitization would."""
+        inputs = [
+            "Will it rain tomorrow?",
+            "BTC-100k by 2025, yes or no?",
+            "my_id is 42",
+            "please select one",
+            "a -- b",
+            "scripting is fun",
+            "padded  spaces",
+        ]
+        
+        for text in inputs:
+            fast = InputSanitizer.sanitize_text(text)
+            with patch.object(InputSanitizer, 'FAST_PATH_PATTERN', Mock(match=Mock(return_value=None))):
+                slow = InputSanitizer.sanitize_text(text)
+            assert fast == slow
+        
+        assert InputSanitizer.sanitize_text("Will it rain tomorrow?") == "Will it rain tomorrow?"
+    
     def test_script_injection_detection(self):
         """Test detection of script injection attempts."""
         sanitizer = InputSanitizer()
@@ -173,6 +193,18 @@ class TestTokenManager:
         assert len(token2) > 0
         assert token1 != token2  # Should be unique
     
+    def test_batch_token_generation(self):
+        """Test generating several tokens at once."""
+        token_manager = TokenManager()
+        
+        tokens = token_manager.generate_secure_tokens(5)
+        
+        assert len(tokens) == 5
+        assert len(set(tokens)) == 5
+        single = token_manager.generate_secure_token()
+        assert all(len(token) == len(single) for token in tokens)
+        assert token_manager.generate_secure_tokens(0) == []
+    
     def test_token_hashing_verification(self):
         """Test token hashing and verification."""
         token_manager = TokenManager()
@@ -226,6 +258,30 @@ class TestDataEncryption:
         decrypted_dict = json.loads(decrypted_data)
         assert decrypted_dict == original_data
     
+    def test_cached_key_across_messages_and_instances(self):
+        """Test that reusing the derived key keeps ciphertexts unique and portable."""
+        encryption = DataEncryption("test_password")
+        
+        first = encryption.encrypt_data("same message")
+        second = encryption.encrypt_data("same message")
+        assert first != second
+        
+        # Another instance with the same password derives the key from the salt
+        other = DataEncryption("test_password")
+        assert other.decrypt_data(first) == "same message"
+        assert encryption.decrypt_data(other.encrypt_data("reply")) == "reply"
+    
+    def test_key_derivation_shared_per_password(self):
+        """Test that instances with the same password reuse the derived key."""
+        from core.security import _derive_key
+        
+        DataEncryption("shared_password").encrypt_data("warm up")
+        misses = _derive_key.cache_info().misses
+        
+        encryption = DataEncryption("shared_password")
+        encryption.encrypt_data("again")
+        assert _derive_key.cache_info().misses == misses
+    
     def test_sensitive_fields_encryption(self):
         """Test encryption of specific fields in a dictionary."""
         encryption = DataEncryption("test_password")
@@ -319,6 +375,36 @@ class TestAuditLogger:
         mock_security_logger.warning.assert_called_once()
 
 
+    @pytest.mark.asyncio
+    @patch('core.security.get_logger')
+    async def test_buffered_audit_logging(self, mock_get_logger):
+        """Test that buffered events are written by flush and the buffer is bounded."""
+        mock_logger = Mock()
+        mock_get_logger.return_value = mock_logger
+        
+        audit_logger = AuditLogger(buffered=True, max_buffered=3)
+        
+        for user_id in range(5):
+            audit_logger.log_user_action(
+                event_type=AuditEventType.BET_PLACED,
+                user_id=user_id,
+                details={'user_id': user_id}
+            )
+        
+        # Nothing written yet; the two oldest events were dropped
+        mock_logger.info.assert_not_called()
+        assert audit_logger.dropped_events == 2
+        
+        await audit_logger.flush()
+        
+        assert mock_logger.info.call_count == 3
+        # The oldest events were dropped, the newest kept in order
+        assert [call[1]['extra']['details'] for call in mock_logger.info.call_args_list] == [
+            {'user_id': 2}, {'user_id': 3}, {'user_id': 4}
+        ]
+        assert audit_logger.dropped_events == 0
+
+
 class TestSecurityMonitor:
     """Test security monitoring functionality."""
     
@@ -51,6 +51,17 @@ class TestValidator:
         # Text with max length
         result = Validator.sanitize_text("Hello World", max_length=5)
         assert result == "Hello"
+        
+        # max_length applies after whitespace and markup are removed
+        result = Validator.sanitize_text(" " * 5000 + "!", max_length=100)
+        assert result == "!"
+        result = Validator.sanitize_text(
+            '<img src="' + "x" * 500 + '" onerror=alert(1)>Yes', max_length=100
+        )
+        assert result == "Yes"
+        
+        # Oversized input is cut before scanning
+        assert len(Validator.sanitize_text("A" * 50_000)) == 10_000
     
     def test_sanitize_text_injection_prevention(self):
         """Test injection attack prevention"""
@@ -66,7 +77,24 @@ class TestValidator:
         # JavaScript protocol
         result = Validator.sanitize_text("javascript:alert('xss')")
         assert "javascript:" not in result.lower()
-    
+        
+        # Patterns joined together by an earlier removal
+        result = Validator.sanitize_text("javdata:ascript:alert(1)")
+        assert "javascript:" not in result.lower()
+        assert "data:" not in result.lower()
+
+        # Removals are not rescanned, so splicing payloads stay linear
+        result = Validator.sanitize_text("d" * 2000 + "ata:" * 2000)
+        assert result == "d" * 1999 + " " + "ata:" * 1999
+
+        # A '<' with no closing '>' after it is kept
+        result = Validator.sanitize_text("<b>bold</b> and 3 < 4 <")
+        assert result == "bold and 3 < 4 <"
+
+        # Inline handlers are removed, including inside longer words
+        result = Validator.sanitize_text("x onclick=y aonload = z")
+        assert result == "x y a z"
+
     def test_validate_discord_id(self):
         """Test Discord ID validation"""
         # Valid Discord ID
@@ -125,6 +153,10 @@ class TestValidator:
         result = Validator.validate_prediction_question("Will there be a SELECT * FROM users?")
         assert not result.is_valid
         assert "dangerous content" in result.errors[0]
+        
+        for payload in ("Will it rain or 1=1 tomorrow?", "Will it rain sleep(5) tomorrow?"):
+            result = Validator.validate_prediction_question(payload)
+            assert "dangerous content" in result.errors[0]
     
     def test_validate_prediction_options(self):
         """Test prediction options validation"""
@@ -137,7 +169,11 @@ class TestValidator:
         result = Validator.validate_prediction_options(["Option A", "Option B", "Option C"])
         assert result.is_valid
         assert len(result.sanitized_data) == 3
-        
+
+        # Markup in one option is sanitized without touching the others
+        result = Validator.validate_prediction_options(["Yes  please", "<b>No</b>", "Maybe\x00"])
+        assert result.sanitized_data == ["Yes please", "No", "Maybe"]
+
         # Too few options
         result = Validator.validate_prediction_options(["Yes"])
         assert not result.is_valid
@@ -152,6 +188,11 @@ class TestValidator:
         assert not result.is_valid  # Should flag duplicates as error
         assert "Duplicate option" in result.errors[0]
         
+        # Duplicates are detected after sanitization, and each one is reported
+        result = Validator.validate_prediction_options(["<b>Yes</b>", "yes", "No", "YES"])
+        assert result.errors == ["Duplicate option: yes", "Duplicate option: YES"]
+        assert result.sanitized_data == ["Yes", "No"]
+        
         # Too many options
         many_options = [f"Option {i}" for i in range(15)]
         result = Validator.validate_prediction_options(many_options)
@@ -256,7 +297,46 @@ class TestValidator:
         result = Validator.validate_duration("")
         assert not result.is_valid
         assert "cannot be empty" in result.errors[0]
-    
+
+        # Caller-supplied start time
+        now = datetime(2024, 1, 1, 12, 0)
+        result = Validator.validate_duration("1d2h", now=now)
+        assert result.sanitized_data == now + timedelta(days=1, hours=2)
+
+    def test_memoized_validators_return_independent_results(self):
+        """Test that cached validators hand out fresh results"""
+        first = Validator.validate_prediction_options(["Yes", "No"])
+        first.sanitized_data.append("Maybe")
+        first.add_error("caller error")
+        
+        hits = Validator.validate_prediction_options.cache_info().hits
+        second = Validator.validate_prediction_options(["Yes", "No"])
+        assert Validator.validate_prediction_options.cache_info().hits == hits + 1
+        assert second.is_valid
+        assert second.sanitized_data == ["Yes", "No"]
+        
+        # Category and prediction ID results are cached too
+        Validator.validate_category("Sports")
+        hits = Validator.validate_category.cache_info().hits
+        result = Validator.validate_category("Sports")
+        assert Validator.validate_category.cache_info().hits == hits + 1
+        assert result.sanitized_data == "sports"
+        assert Validator.validate_prediction_id("pred-1").sanitized_data == "pred-1"
+        assert Validator.validate_prediction_id.cache_info().currsize > 0
+        
+        # Durations are parsed once but the end time is computed per call
+        first_end = Validator.validate_duration("2h").sanitized_data
+        second_end = Validator.validate_duration("2h").sanitized_data
+        assert second_end >= first_end
+
+    def test_validation_result_has_fixed_attributes(self):
+        """Test that ValidationResult uses slots instead of an instance dict"""
+        result = ValidationResult()
+        assert not hasattr(result, '__dict__')
+
+        with pytest.raises(AttributeError):
+            result.unexpected = True
+
     def test_validate_category(self):
         """Test category validation"""
         # Valid category
@@ -351,6 +431,22 @@ class TestValidator:
         result = Validator.validate_pydantic_model(CreatePredictionRequest, invalid_data)
         assert not result.is_valid
         assert len(result.errors) > 0
+    
+    def test_validate_pydantic_models_batch(self):
+        """Test batch Pydantic model validation"""
+        bets = [
+            {"prediction_id": "pred-1", "option": "Yes", "amount": 100},
+            {"prediction_id": "pred-2", "option": "No", "amount": 250},
+        ]
+        result = Validator.validate_pydantic_models(PlaceBetRequest, bets)
+        assert result.is_valid
+        assert [bet.amount for bet in result.sanitized_data] == [100, 250]
+        
+        # Errors are reported with the failing item's index
+        bets.append({"prediction_id": "pred-3", "option": "Yes", "amount": -5})
+        result = Validator.validate_pydantic_models(PlaceBetRequest, bets)
+        assert not result.is_valid
+        assert result.errors[0].startswith("2 -> amount:")
 
 
 class TestValidationDecorator:
@@ -367,6 +463,13 @@ class TestValidationDecorator:
         async def test_function(user_id: int, amount: int):
             return f"User {user_id} bet {amount}"
         
+        assert asyncio.iscoroutinefunction(test_function)
+        
+        # Validation errors surface when the call is awaited
+        pending = test_function("invalid", 100)
+        with pytest.raises(ValidationError):
+            await pending
+        
         # Valid inputs
         result = await test_function("123456789012345678", 100)
         assert "User 123456789012345678 bet 100" in result
@@ -397,6 +500,30 @@ class TestValidationDecorator:
         # Invalid input
         with pytest.raises(ValidationError):
             test_function("Short")
+    
+    def test_validate_input_decorator_method_sanitizes_arguments(self):
+        """Test that sanitized values replace positional and keyword arguments on methods"""
+        
+        class Service:
+            @validate_input(
+                user_id=Validator.validate_discord_id,
+                question=Validator.validate_prediction_question
+            )
+            def ask(self, user_id, question):
+                return user_id, question
+        
+        service = Service()
+        
+        assert service.ask("123456789012345678", "Will it rain tomorrow") == (
+            123456789012345678, "Will it rain tomorrow?"
+        )
+        assert service.ask("123456789012345678", question="Will it rain tomorrow") == (
+            123456789012345678, "Will it rain tomorrow?"
+        )
+        
+        with pytest.raises(ValidationError) as exc_info:
+            service.ask("123456789012345678")
+        assert "question: Required parameter missing" in exc_info.value.details["validation_errors"]
 
 
 class TestRateLimiter:
@@ -438,6 +565,27 @@ class TestRateLimiter:
         result = await limiter.check_rate_limit("test_key", 1, 1)
         assert result is True
     
+    @pytest.mark.asyncio
+    async def test_rate_limiter_no_burst_across_window_boundary(self):
+        """Test that the window slides, so a limit cannot be doubled at a boundary"""
+        limiter = RateLimiter()
+        clock = [1000.0]
+        
+        with patch('core.validation_middleware.time.monotonic', side_effect=lambda: clock[0]):
+            # Two requests at the end of one 60 second period
+            clock[0] = 1059.0
+            assert await limiter.check_rate_limit("burst_key", 2, 60)
+            assert await limiter.check_rate_limit("burst_key", 2, 60)
+            
+            # Just after a fixed-window boundary both are still counted
+            clock[0] = 1061.0
+            assert not await limiter.check_rate_limit("burst_key", 2, 60)
+            assert limiter.get_remaining_time("burst_key", 60) == 58
+            
+            # Once they leave the window, requests are allowed again
+            clock[0] = 1119.5
+            assert await limiter.check_rate_limit("burst_key", 2, 60)
+    
     def test_rate_limiter_remaining_time(self):
         """Test remaining time calculation"""
         limiter = RateLimiter()